@@ -1,21 +1,420 @@
 # src/spacebridge_mcp/duplicate_detection.py
+import asyncio
+import io
+import json
 import logging
 import os
+import re
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Literal, Optional
+from operator import attrgetter
+from typing import Dict, List, Literal, Optional, Set, Tuple
 
+try:
+    import orjson as _json  # Optional speedup: pip install "spacebridge-mcp[speedups]"
+
+    def _dumps(obj) -> str:
+        return _json.dumps(obj).decode("utf-8")
+except ImportError:
+    _json = json
+    _dumps = json.dumps
+
+from .semantic_cache import (
+    BloomFilter,
+    LRUCache,
+    SemanticCache,
+    SemanticCacheStore,
+    dot,
+    make_key,
+    normalize,
+)
 from .tools import IssueSummary
 
 logger = logging.getLogger(__name__)
 
+# Static portions of the duplicate-check prompt, built once at import time.
+_PROMPT_HEADER = (
+    "You are an expert issue tracker assistant. Your task is to determine if a new issue "
+    "is a duplicate of existing issues.\n"
+)
+_PROMPT_CANDIDATES_HEADER = (
+    "\n\nPotential Existing Duplicates Found via Similarity Search:\n---\n"
+)
+_PROMPT_FOOTER = (
+    "\n---\n"
+    "\n"
+    "Based on the information above, is the 'New Issue' a likely duplicate of *any* of "
+    "the 'Potential Existing Duplicates'?\n"
+    "\n"
+    'Respond with ONLY a JSON object with a single "duplicate_id" field:\n'
+    '1.  If it IS a duplicate: the ID of the existing issue, e.g., {"duplicate_id": "SB-123"}\n'
+    '2.  If it is NOT a duplicate: {"duplicate_id": null}\n'
+)
+
+# Structured-output schema for the duplicate-check reply.
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "dup_check",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"duplicate_id": {"type": ["string", "null"]}},
+            "required": ["duplicate_id"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Prompt and schema for checking several new issues in one request. Each new
+# issue is written as in the single prompt, followed by its own candidates.
+_BATCH_PROMPT_HEADER = (
+    "You are an expert issue tracker assistant. Your task is to determine, for each "
+    "of several new issues, if it is a duplicate of the existing issues listed "
+    "with it.\n"
+)
+_BATCH_PROMPT_FOOTER = (
+    "\n---\n"
+    "\n"
+    "For each 'New Issue' in order, is it a likely duplicate of *any* of its own "
+    "'Potential Existing Duplicates'?\n"
+    "\n"
+    'Respond with ONLY a JSON object with a "duplicate_ids" list holding one entry '
+    "per new issue: the ID of the existing issue it duplicates, or null if it is "
+    'not a duplicate, e.g., {"duplicate_ids": ["SB-123", null]}\n'
+)
+_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "dup_check_batch",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "duplicate_ids": {
+                    "type": "array",
+                    "items": {"type": ["string", "null"]},
+                }
+            },
+            "required": ["duplicate_ids"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Candidate descriptions are cut to this many characters in the prompt, and
+# omitted for candidates scoring below the cutoff, to keep input tokens down.
+# The new issue's description gets a larger budget as it is the one being judged.
+_MAX_PROMPT_DESCRIPTION_CHARS = 400
+_MAX_PROMPT_NEW_DESCRIPTION_CHARS = 1000
+_PROMPT_DESCRIPTION_SCORE_CUTOFF = 0.5
+
+# Candidates sharing fewer words than DUPLICATE_LEXICAL_FLOOR (Jaccard similarity
+# of their word sets) with the new issue are dropped before the LLM sees them.
+# Off by default: duplicates phrased with synonyms can share no words at all.
+DEFAULT_LEXICAL_FLOOR = 0.0
+_WORD_RE = re.compile(r"\w+")
+
+# Fallback for OpenAI-compatible endpoints that ignore response_format and reply in
+# plain text: "DUPLICATE: <id>" (group 1) or "NOT_DUPLICATE".
+_RESPONSE_RE = re.compile(r"^\s*(?:DUPLICATE:\s*(\S+)|NOT_DUPLICATE)\s*$")
+
+
+def _shorten(text: str, max_chars: int) -> str:
+    """Cuts text to max_chars, marking the cut with an ellipsis."""
+    if len(text) > max_chars:
+        return text[:max_chars] + "…"
+    return text
+
+
+def _words(*texts: Optional[str]) -> frozenset:
+    """Returns the set of lower-cased words in the given texts."""
+    return frozenset(
+        word for text in texts if text for word in _WORD_RE.findall(text.lower())
+    )
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity of two word sets."""
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+def _prompt_description(dup: IssueSummary) -> str:
+    """Returns the candidate description as it should appear in the prompt."""
+    if not dup.description or (
+        dup.score is not None and dup.score < _PROMPT_DESCRIPTION_SCORE_CUTOFF
+    ):
+        return "N/A"
+    return _shorten(dup.description, _MAX_PROMPT_DESCRIPTION_CHARS)
+
+
+def _write_check(
+    buf: io.StringIO,
+    new_title: str,
+    new_description: str,
+    duplicates_to_check: List[IssueSummary],
+) -> int:
+    """
+    Writes the new issue and its candidates into a prompt buffer.
+
+    Returns how many candidate descriptions were shortened.
+    """
+    for part in (
+        "\nNew Issue Details:\nTitle: ",
+        new_title,
+        "\nDescription: ",
+        _shorten(new_description, _MAX_PROMPT_NEW_DESCRIPTION_CHARS),
+        _PROMPT_CANDIDATES_HEADER,
+    ):
+        buf.write(part)
+    shortened = 0
+    for index, dup in enumerate(duplicates_to_check):
+        description = _prompt_description(dup)
+        shortened += description != (dup.description or "N/A")
+        if index:
+            buf.write("\n\n")
+        buf.write("Existing Issue ID: ")
+        buf.write(dup.id)
+        buf.write("\nTitle: ")
+        buf.write(dup.title)
+        buf.write("\nDescription: ")
+        buf.write(description)
+        buf.write("\nScore: ")
+        buf.write(str(dup.score or "N/A"))
+    return shortened
+
+
+def _get_float_env(name: str, default: float) -> float:
+    """Reads a float from the environment, falling back to default if unset or invalid."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(
+            "Invalid value for %s: '%s'. Using default: %s", name, value, default
+        )
+        return default
+
+
+# The SDK defaults (10 min timeout, 2 retries) would let one slow call stall
+# issue creation; a duplicate check is short and can fall back when it fails.
+DEFAULT_OPENAI_TIMEOUT = 8.0  # Seconds
+_OPENAI_CONNECT_TIMEOUT = 2.0
+_OPENAI_MAX_RETRIES = 1
+
+
+def make_shared_client(api_key: str, base_url: Optional[str] = None):
+    """
+    Builds the long-lived AsyncOpenAI client shared by all detectors.
+
+    The underlying connection pool keeps connections alive between duplicate
+    checks so each LLM or embeddings call can skip connection and TLS setup.
+    Requests time out after OPENAI_TIMEOUT seconds and are retried once.
+    """
+    # Imported here: openai is slow to import and only needed once at startup.
+    import httpx
+    import openai
+
+    timeout = _get_float_env("OPENAI_TIMEOUT", DEFAULT_OPENAI_TIMEOUT)
+    http_client = openai.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=500, max_keepalive_connections=100, keepalive_expiry=60
+        )
+    )
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=http_client,
+        timeout=httpx.Timeout(timeout, connect=min(timeout, _OPENAI_CONNECT_TIMEOUT)),
+        max_retries=_OPENAI_MAX_RETRIES,
+    )
+
+
+def issue_text(title: str, description: str) -> str:
+    """Returns the combined text used to search for and embed an issue."""
+    return f"{title}\n\n{description}"
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding requests into batched API calls.
+
+    Texts are collected until max_batch_size are pending or window_seconds has
+    passed since the first, then embedded with a single embeddings.create call.
+    """
+
+    def __init__(
+        self,
+        client,
+        model: str,
+        max_batch_size: int = 64,
+        window_seconds: float = 0.01,
+    ):
+        self.client = client
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.window_seconds = window_seconds
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # The loop only keeps weak references to tasks; hold batches in flight
+        # here so none is garbage-collected before resolving its futures.
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> List[float]:
+        """Returns the embedding of text once its batch completes."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # State left over from another event loop can never be flushed.
+            self._loop, self._pending, self._timer = loop, [], None
+        future = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._start_batch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._start_batch)
+        return await future
+
+    def _start_batch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = self._loop.create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            response = await self.client.embeddings.create(
+                model=self.model, input=[text for text, _ in batch]
+            )
+            # Pair results with inputs by their index, falling back to position
+            # for OpenAI-compatible endpoints that leave it out.
+            embeddings = {}
+            for position, item in enumerate(response.data):
+                index = getattr(item, "index", None)
+                if not isinstance(index, int):
+                    index = position
+                embeddings[index] = list(item.embedding)
+        except Exception as embed_error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(embed_error)
+            return
+        logger.debug("Embedded %s texts in one request.", len(batch))
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            embedding = embeddings.get(index)
+            if embedding is None:
+                future.set_exception(
+                    ValueError(f"Embeddings response has no result for input {index}")
+                )
+            else:
+                future.set_result(embedding)
+
+
+# One batcher per client and model, dropped along with the client.
+_embedding_batchers: "weakref.WeakKeyDictionary[object, Dict[str, EmbeddingBatcher]]" = weakref.WeakKeyDictionary()
+
+# Recent embeddings, so the same text is embedded once per request even when
+# several caches look it up.
+_embedding_cache: LRUCache[List[float]] = LRUCache(maxsize=256)
+
+
+async def embed_text(
+    client, text: str, model: Optional[str] = None
+) -> Optional[List[float]]:
+    """
+    Embeds text with the OpenAI embeddings API.
+
+    Concurrent calls are batched into one request per client and model. Returns
+    None if the call fails. Results are memoized per model and text.
+    """
+    model = model or os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+    key = make_key(model, text)
+    embedding = _embedding_cache.get(key)
+    if embedding is not None:
+        return embedding
+    batchers = _embedding_batchers.setdefault(client, {})
+    batcher = batchers.get(model)
+    if batcher is None:
+        batcher = batchers[model] = EmbeddingBatcher(client, model)
+    try:
+        embedding = await batcher.embed(text)
+    except Exception as embed_error:
+        logger.warning(
+            "Could not embed text for semantic cache lookup: %s", embed_error
+        )
+        return None
+    _embedding_cache.put(key, embedding)
+    return embedding
+
 
 # Decision structure returned by detectors
-@dataclass
+@dataclass(slots=True)
 class DuplicateDecision:
     status: Literal["duplicate", "not_duplicate", "undetermined"]
     duplicate_issue: Optional[IssueSummary] = None  # Include full details if duplicate
 
+    def to_json(self) -> str:
+        """Serializes the decision, e.g. for a persistent cache."""
+        issue = self.duplicate_issue
+        return _dumps(
+            {
+                "status": self.status,
+                "duplicate_issue": issue.model_dump() if issue is not None else None,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "DuplicateDecision":
+        """Rebuilds a decision serialized with to_json."""
+        data = _json.loads(text)
+        issue = data["duplicate_issue"]
+        return cls(
+            status=data["status"],
+            duplicate_issue=IssueSummary.model_validate(issue) if issue else None,
+        )
+
+
+def _top_scored(
+    potential_duplicates: List[IssueSummary],
+) -> Optional[IssueSummary]:
+    """Returns the highest-scoring candidate, or None if no candidate has a score."""
+    return max(
+        (dup for dup in potential_duplicates if dup.score is not None),
+        key=attrgetter("score"),
+        default=None,
+    )
+
+
+def _decision_for_id(
+    potential_id: Optional[str], duplicates_to_check: List[IssueSummary]
+) -> DuplicateDecision:
+    """Turns the duplicate ID picked by the LLM (None for none) into a decision."""
+    if potential_id is None:
+        logger.info("LLM confirmed not a duplicate.")
+        return DuplicateDecision(status="not_duplicate")
+
+    # Find the full IssueSummary object for the matched ID
+    matched = {dup.id: dup for dup in duplicates_to_check}.get(potential_id)
+    if matched is not None:
+        logger.info("LLM identified duplicate: %s", matched.id)
+        return DuplicateDecision(status="duplicate", duplicate_issue=matched)
+    logger.warning(
+        "LLM reported duplicate ID '%s' but it wasn't in the top %s checked.",
+        potential_id,
+        len(duplicates_to_check),
+    )
+    return DuplicateDecision(status="undetermined")
+
 
 # --- Abstract Base Class ---
 
@@ -23,6 +422,10 @@ class DuplicateDecision:
 class DuplicateDetector(ABC):
     """Abstract base class for duplicate issue detection strategies."""
 
+    # How many of the top search results the detector looks at (None means all),
+    # so callers can skip preparing candidates that would be ignored anyway.
+    max_candidates: Optional[int] = None
+
     @abstractmethod
     async def check_duplicates(
         self,
@@ -50,12 +453,48 @@ class DuplicateDetector(ABC):
 class OpenAIDuplicateDetector(DuplicateDetector):
     """Uses OpenAI's LLM to compare potential duplicates."""
 
-    def __init__(self, client):
+    DEFAULT_SEMANTIC_CACHE_THRESHOLD = 0.95  # Cosine similarity for a semantic hit
+    max_candidates = 3  # Consider making this configurable
+
+    # Shared across instances so cached decisions outlive per-request detectors.
+    _decision_cache: LRUCache[DuplicateDecision] = LRUCache(maxsize=1024)
+    _semantic_cache: SemanticCache[DuplicateDecision] = SemanticCache(maxsize=1024)
+    # Compactly remembers far more negative outcomes than the exact cache holds.
+    # Only used to skip the semantic cache: a false positive must not decide a verdict.
+    _not_duplicate_keys = BloomFilter(capacity=100_000, error_rate=0.001)
+
+    def __init__(self, client, model_name: Optional[str] = None):
         if client is None:
             raise ValueError(
                 "OpenAI client must be provided for OpenAIDuplicateDetector"
             )
         self.openai_client = client
+        # Use environment variable for model name, fallback to gpt-4o-mini: a small
+        # model is ample for this classification at a fraction of the cost and latency
+        self.model_name = model_name or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self.embedding_model = os.getenv(
+            "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
+        )
+        self.semantic_cache_threshold = _get_float_env(
+            "SEMANTIC_CACHE_THRESHOLD", self.DEFAULT_SEMANTIC_CACHE_THRESHOLD
+        )
+        self.lexical_floor = _get_float_env(
+            "DUPLICATE_LEXICAL_FLOOR", DEFAULT_LEXICAL_FLOOR
+        )
+
+    @classmethod
+    def attach_store(cls, store: SemanticCacheStore) -> int:
+        """
+        Persists the shared semantic decision cache in the given store.
+
+        Returns the number of decisions restored from earlier runs.
+        """
+        return cls._semantic_cache.attach(
+            store,
+            "duplicate_decisions",
+            DuplicateDecision.to_json,
+            DuplicateDecision.from_json,
+        )
 
     async def check_duplicates(
         self,
@@ -63,100 +502,388 @@ class OpenAIDuplicateDetector(DuplicateDetector):
         new_description: str,
         potential_duplicates: List[IssueSummary],
     ) -> DuplicateDecision:
-        """Performs LLM comparison to detect duplicates."""
+        """
+        Performs LLM comparison to detect duplicates.
+
+        Decisions are cached: an identical request (same title, description and
+        candidate IDs) is answered from an exact cache, and a near-identical one
+        from a semantic cache keyed on the embedding of the new issue, scoped to
+        the same candidate set. Keys of not-duplicate outcomes are also kept in
+        a Bloom filter, which outlives evictions from the exact cache; a key
+        found there skips the embedding and semantic cache and goes straight to
+        the LLM, so a false positive never turns into a verdict.
+        Undetermined outcomes are never cached.
+        """
         if not potential_duplicates:
             return DuplicateDecision(status="not_duplicate")
 
-        top_n = 3  # Consider making this configurable
-        duplicates_to_check = potential_duplicates[:top_n]
-        duplicates_context = "\n\n".join(
-            [
-                f"Existing Issue ID: {dup.id}\nTitle: {dup.title}\nDescription: {dup.description or 'N/A'}\nScore: {dup.score or 'N/A'}"
-                for dup in duplicates_to_check
-            ]
+        duplicates_to_check = self._lexical_prefilter(
+            new_title, new_description, potential_duplicates[: self.max_candidates]
         )
+        if not duplicates_to_check:
+            logger.info("No candidate passed the lexical prefilter; not a duplicate.")
+            return DuplicateDecision(status="not_duplicate")
+        candidate_ids = sorted(dup.id for dup in duplicates_to_check)
 
-        prompt = f"""You are an expert issue tracker assistant. Your task is to determine if a new issue is a duplicate of existing issues.
+        cache_key = make_key(new_title, new_description, *candidate_ids)
+        cached = self._decision_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Duplicate check served from exact cache.")
+            return cached
+        known_negative = cache_key in self._not_duplicate_keys
+        if known_negative:
+            logger.info(
+                "Likely checked before as not a duplicate; rechecking with LLM."
+            )
+
+        namespace = tuple(candidate_ids)
+        embedding = None
+        if self.semantic_cache_threshold > 0 and not known_negative:
+            embedding = await self._embed(issue_text(new_title, new_description))
+            if embedding is not None:
+                cached = self._semantic_cache.lookup(
+                    embedding, namespace, self.semantic_cache_threshold
+                )
+                if cached is not None:
+                    logger.info("Duplicate check served from semantic cache.")
+                    self._decision_cache.put(cache_key, cached)
+                    return cached
 
-New Issue Details:
-Title: {new_title}
-Description: {new_description}
+        decision = await self._ask_llm(new_title, new_description, duplicates_to_check)
+        if decision.status != "undetermined":
+            self._decision_cache.put(cache_key, decision)
+            if decision.status == "not_duplicate":
+                self._not_duplicate_keys.add(cache_key)
+            if embedding is not None:
+                self._semantic_cache.add(embedding, decision, namespace)
+        return decision
 
-Potential Existing Duplicates Found via Similarity Search:
----
-{duplicates_context}
----
+    def _lexical_prefilter(
+        self,
+        new_title: str,
+        new_description: str,
+        candidates: List[IssueSummary],
+    ) -> List[IssueSummary]:
+        """
+        Drops candidates too lexically different from the new issue to be worth
+        asking the LLM about. A candidate is kept if either its title or its full
+        text overlaps the new issue's by at least lexical_floor (0 disables).
+        """
+        if self.lexical_floor <= 0:
+            return candidates
+        new_title_words = _words(new_title)
+        new_words = new_title_words | _words(new_description)
+        kept = [
+            dup
+            for dup in candidates
+            if _jaccard(new_title_words, _words(dup.title)) >= self.lexical_floor
+            or _jaccard(new_words, _words(dup.title, dup.description))
+            >= self.lexical_floor
+        ]
+        if len(kept) < len(candidates):
+            logger.info(
+                "Lexical prefilter dropped %s of %s candidates.",
+                len(candidates) - len(kept),
+                len(candidates),
+            )
+        return kept
 
-Based on the information above, is the 'New Issue' a likely duplicate of *any* of the 'Potential Existing Duplicates'?
+    async def _embed(self, text: str) -> Optional[List[float]]:
+        """Embeds text for the semantic cache. Returns None if embedding fails."""
+        return await embed_text(self.openai_client, text, self.embedding_model)
 
-Respond with ONLY one of the following:
-1.  If it IS a duplicate: DUPLICATE: [ID of the existing issue, e.g., SB-123]
-2.  If it is NOT a duplicate: NOT_DUPLICATE
-"""
-        logger.info(f"Sending comparison prompt to LLM for new issue '{new_title}'...")
+    async def _ask_llm(
+        self,
+        new_title: str,
+        new_description: str,
+        duplicates_to_check: List[IssueSummary],
+    ) -> DuplicateDecision:
+        """Asks the LLM whether the new issue duplicates any of the candidates."""
+        buf = io.StringIO()
+        buf.write(_PROMPT_HEADER)
+        shortened = _write_check(buf, new_title, new_description, duplicates_to_check)
+        buf.write(_PROMPT_FOOTER)
+        prompt = buf.getvalue()
+        logger.debug(
+            "Shortened %s of %s candidate descriptions in the prompt.",
+            shortened,
+            len(duplicates_to_check),
+        )
+        logger.info("Sending comparison prompt to LLM for new issue '%s'...", new_title)
         try:
-            # Use environment variable for model name, fallback to gpt-4o
-            model_name = os.getenv("OPENAI_MODEL", "gpt-4o")
             llm_response = await self.openai_client.chat.completions.create(
-                model=model_name,
+                model=self.model_name,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.2,
-                max_tokens=50,  # Increased slightly for safety
-            )
-            llm_decision_raw = llm_response.choices[0].message.content.strip()
-            logger.info(f"LLM response received: '{llm_decision_raw}'")
-
-            if llm_decision_raw.startswith("DUPLICATE:"):
-                parts = llm_decision_raw.split(":", 1)
-                if len(parts) == 2:
-                    potential_id = parts[1].strip()
-                    # Find the full IssueSummary object for the matched ID
-                    matched_dup = next(
-                        (dup for dup in duplicates_to_check if dup.id == potential_id),
-                        None,
-                    )
-                    if matched_dup:
-                        logger.info(f"LLM identified duplicate: {matched_dup.id}")
-                        return DuplicateDecision(
-                            status="duplicate", duplicate_issue=matched_dup
-                        )
-                    else:
-                        logger.warning(
-                            f"LLM reported duplicate ID '{potential_id}' but it wasn't in the top {top_n} checked."
-                        )
-                        return DuplicateDecision(status="undetermined")
-                else:
+                max_tokens=20,
+                response_format=_RESPONSE_FORMAT,
+            )
+            llm_decision_raw = llm_response.choices[0].message.content
+            logger.info("LLM response received: '%s'", llm_decision_raw)
+
+            try:
+                potential_id = _json.loads(llm_decision_raw)["duplicate_id"]
+            except (ValueError, TypeError, KeyError):
+                match = _RESPONSE_RE.match(llm_decision_raw)
+                if match is None:
                     logger.warning(
-                        f"LLM response started with DUPLICATE: but format was unexpected: {llm_decision_raw}"
+                        "LLM response was not in the expected format: %s",
+                        llm_decision_raw,
                     )
                     return DuplicateDecision(status="undetermined")
+                potential_id = match.group(1)
 
-            elif llm_decision_raw == "NOT_DUPLICATE":
-                logger.info("LLM confirmed not a duplicate.")
-                return DuplicateDecision(status="not_duplicate")
-            else:
-                logger.warning(
-                    f"LLM response was not in the expected format: {llm_decision_raw}"
-                )
-                return DuplicateDecision(status="undetermined")
+            return _decision_for_id(potential_id, duplicates_to_check)
 
         except Exception as llm_error:
             logger.error(
-                f"Error calling OpenAI API for duplicate check: {llm_error}",
+                "Error calling OpenAI API for duplicate check: %s",
+                llm_error,
                 exc_info=True,
             )
             return DuplicateDecision(status="undetermined")
 
 
+class PairwiseOpenAIDuplicateDetector(OpenAIDuplicateDetector):
+    """
+    OpenAI detector that compares the new issue against each candidate separately.
+
+    Each candidate gets its own small yes/no prompt, and all comparisons run
+    concurrently, so latency is that of the slowest single comparison rather
+    than one long prompt. The short prompts suit a smaller, cheaper model
+    (OPENAI_PAIRWISE_MODEL, default gpt-4o-mini).
+    """
+
+    def __init__(self, client, model_name: Optional[str] = None):
+        super().__init__(
+            client,
+            model_name=model_name or os.getenv("OPENAI_PAIRWISE_MODEL", "gpt-4o-mini"),
+        )
+
+    async def _ask_llm(
+        self,
+        new_title: str,
+        new_description: str,
+        duplicates_to_check: List[IssueSummary],
+    ) -> DuplicateDecision:
+        """Runs one comparison per candidate and returns the highest-ranked match."""
+        logger.info(
+            "Sending %s pairwise comparison prompts to LLM for new issue '%s'...",
+            len(duplicates_to_check),
+            new_title,
+        )
+        verdicts = await asyncio.gather(
+            *(
+                self._pair_check(new_title, new_description, dup)
+                for dup in duplicates_to_check
+            )
+        )
+        # Candidates arrive sorted by score, so the first match is the best one.
+        for dup, verdict in zip(duplicates_to_check, verdicts):
+            if verdict:
+                logger.info("LLM identified duplicate: %s", dup.id)
+                return DuplicateDecision(status="duplicate", duplicate_issue=dup)
+        if None in verdicts:
+            return DuplicateDecision(status="undetermined")
+        logger.info("LLM confirmed not a duplicate.")
+        return DuplicateDecision(status="not_duplicate")
+
+    async def _pair_check(
+        self, new_title: str, new_description: str, candidate: IssueSummary
+    ) -> Optional[bool]:
+        """Asks whether two issues are the same. Returns None if undetermined."""
+        prompt = "".join(
+            (
+                "Issue A:\nTitle: ",
+                new_title,
+                "\nDescription: ",
+                _shorten(new_description, _MAX_PROMPT_NEW_DESCRIPTION_CHARS),
+                "\n\nIssue B:\nTitle: ",
+                candidate.title,
+                "\nDescription: ",
+                _shorten(candidate.description or "N/A", _MAX_PROMPT_DESCRIPTION_CHARS),
+                "\n\nDo Issue A and Issue B describe the same problem or request? "
+                "Respond with ONLY YES or NO.",
+            )
+        )
+        try:
+            llm_response = await self.openai_client.chat.completions.create(
+                model=self.model_name,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.0,
+                max_tokens=5,
+            )
+            answer = llm_response.choices[0].message.content.strip().upper()
+        except Exception as llm_error:
+            logger.error(
+                "Error calling OpenAI API for pairwise duplicate check against %s: %s",
+                candidate.id,
+                llm_error,
+                exc_info=True,
+            )
+            return None
+        if answer.startswith("YES"):
+            return True
+        if answer.startswith("NO"):
+            return False
+        logger.warning(
+            "Pairwise LLM response for %s was not YES or NO: %s", candidate.id, answer
+        )
+        return None
+
+
+class BatchedOpenAIDuplicateDetector(OpenAIDuplicateDetector):
+    """
+    OpenAI detector that coalesces LLM comparisons arriving within a short window.
+
+    Comparisons are collected for DUPLICATE_BATCH_WINDOW_MS. Identical ones
+    share a single answer, and distinct ones are sent together, up to
+    MAX_CHECKS_PER_PROMPT per LLM call, asking for one verdict per new issue.
+    If a combined reply can't be used, its checks are retried one by one.
+    """
+
+    DEFAULT_BATCH_WINDOW_MS = 50.0
+    MAX_CHECKS_PER_PROMPT = 8
+
+    # Shared across instances so requests served by different detectors coalesce.
+    _pending: Dict[
+        bytes, Tuple["OpenAIDuplicateDetector", tuple, List[asyncio.Future]]
+    ] = {}
+    _flush_task: Optional[asyncio.Task] = None
+
+    def __init__(self, client, model_name: Optional[str] = None):
+        super().__init__(client, model_name=model_name)
+        self.batch_window = (
+            _get_float_env("DUPLICATE_BATCH_WINDOW_MS", self.DEFAULT_BATCH_WINDOW_MS)
+            / 1000
+        )
+
+    async def _ask_llm(
+        self,
+        new_title: str,
+        new_description: str,
+        duplicates_to_check: List[IssueSummary],
+    ) -> DuplicateDecision:
+        """Queues the comparison and waits for the batch it lands in to complete."""
+        key = make_key(
+            new_title, new_description, *(dup.id for dup in duplicates_to_check)
+        )
+        future = asyncio.get_running_loop().create_future()
+        cls = BatchedOpenAIDuplicateDetector
+        if cls._flush_task is not None and cls._flush_task.done():
+            # The event loop that owned the previous batch went away before flushing.
+            cls._pending, cls._flush_task = {}, None
+        if key in cls._pending:
+            cls._pending[key][2].append(future)
+        else:
+            cls._pending[key] = (
+                self,
+                (new_title, new_description, duplicates_to_check),
+                [future],
+            )
+        if cls._flush_task is None:
+            cls._flush_task = asyncio.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Sends every comparison queued during the window and resolves its waiters."""
+        cls = BatchedOpenAIDuplicateDetector
+        await asyncio.sleep(self.batch_window)
+        batch = cls._pending
+        cls._pending = {}
+        cls._flush_task = None
+        logger.info("Dispatching %s batched duplicate check(s) to LLM.", len(batch))
+
+        entries = list(batch.values())
+        size = self.MAX_CHECKS_PER_PROMPT
+        groups = [entries[i : i + size] for i in range(0, len(entries), size)]
+        results = await asyncio.gather(*(self._ask_llm_many(group) for group in groups))
+        for group, decisions in zip(groups, results):
+            for (_, _, waiters), decision in zip(group, decisions):
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(decision)
+
+    async def _ask_llm_many(
+        self, entries: List[Tuple["OpenAIDuplicateDetector", tuple, list]]
+    ) -> List[DuplicateDecision]:
+        """Asks the LLM about several comparisons at once, one decision each."""
+        checks = [args for _, args, _ in entries]
+        if len(checks) > 1:
+            decisions = await self._ask_llm_combined(checks)
+            if decisions is not None:
+                return decisions
+        return await asyncio.gather(
+            *(
+                OpenAIDuplicateDetector._ask_llm(detector, *args)
+                for detector, args, _ in entries
+            )
+        )
+
+    async def _ask_llm_combined(
+        self, checks: List[tuple]
+    ) -> Optional[List[DuplicateDecision]]:
+        """
+        Sends several comparisons in a single prompt. Returns None if the call
+        fails or the reply doesn't hold exactly one verdict per comparison.
+        """
+        buf = io.StringIO()
+        buf.write(_BATCH_PROMPT_HEADER)
+        for number, check in enumerate(checks, start=1):
+            buf.write(f"\n=== New Issue {number} ===")
+            _write_check(buf, *check)
+        buf.write(_BATCH_PROMPT_FOOTER)
+        logger.info(
+            "Sending combined comparison prompt to LLM for %s new issues...",
+            len(checks),
+        )
+        try:
+            llm_response = await self.openai_client.chat.completions.create(
+                model=self.model_name,
+                messages=[{"role": "user", "content": buf.getvalue()}],
+                temperature=0.2,
+                max_tokens=20 * len(checks),
+                response_format=_BATCH_RESPONSE_FORMAT,
+            )
+            raw = llm_response.choices[0].message.content
+            logger.info("LLM response received: '%s'", raw)
+            potential_ids = _json.loads(raw)["duplicate_ids"]
+        except Exception as llm_error:
+            logger.warning(
+                "Combined duplicate check failed, checking one by one: %s", llm_error
+            )
+            return None
+        if not isinstance(potential_ids, list) or len(potential_ids) != len(checks):
+            logger.warning(
+                "LLM returned %s verdicts for %s new issues, checking one by one.",
+                len(potential_ids) if isinstance(potential_ids, list) else "no",
+                len(checks),
+            )
+            return None
+        return [
+            _decision_for_id(potential_id, check[2])
+            for potential_id, check in zip(potential_ids, checks)
+        ]
+
+
 class ThresholdDuplicateDetector(DuplicateDetector):
-    """Compares the top similarity search result score against a threshold."""
+    """
+    Compares the top similarity search result score against a threshold.
+
+    If an OpenAI client is given, candidates that arrive without a score are
+    scored locally by cosine similarity of their embeddings to the new issue.
+    """
 
     DEFAULT_THRESHOLD = 0.75  # Default threshold if env var is not set
 
-    def __init__(self):
+    def __init__(self, client=None):
         self.threshold = self._get_threshold()
+        self.client = client
+        self.embedding_model = os.environ.get(
+            "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
+        )
         logger.info(
-            f"Initialized ThresholdDuplicateDetector with threshold: {self.threshold}"
+            "Initialized ThresholdDuplicateDetector with threshold: %s", self.threshold
         )
 
     def _get_threshold(self) -> float:
@@ -167,13 +894,15 @@ class ThresholdDuplicateDetector(DuplicateDetector):
                 return float(threshold_str)
             else:
                 logger.info(
-                    f"DUPLICATE_SIMILARITY_THRESHOLD not set, using default: {self.DEFAULT_THRESHOLD}"
+                    "DUPLICATE_SIMILARITY_THRESHOLD not set, using default: %s",
+                    self.DEFAULT_THRESHOLD,
                 )
                 return self.DEFAULT_THRESHOLD
         except ValueError:
             logger.warning(
-                f"Invalid value for DUPLICATE_SIMILARITY_THRESHOLD: '{threshold_str}'. "
-                f"Using default: {self.DEFAULT_THRESHOLD}"
+                "Invalid value for DUPLICATE_SIMILARITY_THRESHOLD: '%s'. Using default: %s",
+                threshold_str,
+                self.DEFAULT_THRESHOLD,
             )
             return self.DEFAULT_THRESHOLD
 
@@ -188,32 +917,154 @@ class ThresholdDuplicateDetector(DuplicateDetector):
             logger.debug("ThresholdDetector: No potential duplicates found.")
             return DuplicateDecision(status="not_duplicate")
 
-        # Assuming potential_duplicates are sorted by score descending by the search client
-        top_duplicate = potential_duplicates[0]
+        if self.client is not None and any(
+            dup.score is None for dup in potential_duplicates
+        ):
+            potential_duplicates = await self._score_locally(
+                new_title, new_description, potential_duplicates
+            )
+
+        # Pick the best score directly rather than relying on the search order
+        top_duplicate = _top_scored(potential_duplicates)
 
-        # Check if the IssueSummary actually has a score
-        if top_duplicate.score is None:
+        # Check if any IssueSummary actually has a score
+        if top_duplicate is None:
             logger.warning(
-                f"ThresholdDetector: Top potential duplicate {top_duplicate.id} has no similarity score. Treating as undetermined."
+                "ThresholdDetector: No potential duplicate has a similarity score. Treating as undetermined."
             )
             # Cannot make a decision based on threshold without a score
             return DuplicateDecision(status="undetermined")
 
         logger.debug(
-            f"ThresholdDetector: Top duplicate {top_duplicate.id} score: {top_duplicate.score:.4f}, Threshold: {self.threshold:.4f}"
+            "ThresholdDetector: Top duplicate %s score: %.4f, Threshold: %.4f",
+            top_duplicate.id,
+            top_duplicate.score,
+            self.threshold,
         )
 
         if top_duplicate.score >= self.threshold:
             logger.info(
-                f"ThresholdDetector: Score {top_duplicate.score:.4f} >= {self.threshold:.4f}. Found duplicate: {top_duplicate.id}"
+                "ThresholdDetector: Score %.4f >= %.4f. Found duplicate: %s",
+                top_duplicate.score,
+                self.threshold,
+                top_duplicate.id,
             )
             return DuplicateDecision(status="duplicate", duplicate_issue=top_duplicate)
         else:
             logger.info(
-                f"ThresholdDetector: Score {top_duplicate.score:.4f} < {self.threshold:.4f}. Not a duplicate."
+                "ThresholdDetector: Score %.4f < %.4f. Not a duplicate.",
+                top_duplicate.score,
+                self.threshold,
             )
             return DuplicateDecision(status="not_duplicate")
 
+    async def _score_locally(
+        self,
+        new_title: str,
+        new_description: str,
+        potential_duplicates: List[IssueSummary],
+    ) -> List[IssueSummary]:
+        """Fills in missing scores from one batched embeddings call."""
+        unscored = [dup for dup in potential_duplicates if dup.score is None]
+        texts = [issue_text(new_title, new_description)]
+        texts.extend(issue_text(dup.title, dup.description or "") for dup in unscored)
+        try:
+            response = await self.client.embeddings.create(
+                model=self.embedding_model, input=texts
+            )
+        except Exception as embed_error:
+            logger.warning(
+                "ThresholdDetector: Could not embed candidates for local scoring: %s",
+                embed_error,
+            )
+            return potential_duplicates
+        if len(response.data) != len(texts):
+            logger.warning(
+                "ThresholdDetector: Expected %s embeddings for local scoring, got %s.",
+                len(texts),
+                len(response.data),
+            )
+            return potential_duplicates
+
+        query, *vectors = (normalize(item.embedding) for item in response.data)
+        scores = iter([dot(query, vector) for vector in vectors])
+        return [
+            dup
+            if dup.score is not None
+            else dup.model_copy(update={"score": next(scores)})
+            for dup in potential_duplicates
+        ]
+
+
+class HybridDuplicateDetector(DuplicateDetector):
+    """
+    Settles clear-cut cases from the top similarity score and defers the rest.
+
+    A top score at or above the high threshold is treated as a duplicate and one
+    below the low threshold as not a duplicate, without any LLM round-trip. Only
+    scores in the uncertain band between them (or missing scores) are passed on
+    to the wrapped detector.
+    """
+
+    DEFAULT_HIGH_THRESHOLD = 0.9
+    DEFAULT_LOW_THRESHOLD = 0.4
+
+    def __init__(
+        self,
+        detector: DuplicateDetector,
+        threshold_high: Optional[float] = None,
+        threshold_low: Optional[float] = None,
+    ):
+        self.detector = detector
+        self.threshold_high = (
+            threshold_high
+            if threshold_high is not None
+            else _get_float_env(
+                "DUPLICATE_AUTO_ACCEPT_THRESHOLD", self.DEFAULT_HIGH_THRESHOLD
+            )
+        )
+        self.threshold_low = (
+            threshold_low
+            if threshold_low is not None
+            else _get_float_env(
+                "DUPLICATE_AUTO_REJECT_THRESHOLD", self.DEFAULT_LOW_THRESHOLD
+            )
+        )
+
+    async def check_duplicates(
+        self,
+        new_title: str,
+        new_description: str,
+        potential_duplicates: List[IssueSummary],
+    ) -> DuplicateDecision:
+        """Short-circuits on the top score, otherwise delegates to the wrapped detector."""
+        if not potential_duplicates:
+            return DuplicateDecision(status="not_duplicate")
+
+        top_duplicate = _top_scored(potential_duplicates)
+        if top_duplicate is not None:
+            if top_duplicate.score >= self.threshold_high:
+                logger.info(
+                    "HybridDetector: Score %.4f >= %.4f. Found duplicate: %s",
+                    top_duplicate.score,
+                    self.threshold_high,
+                    top_duplicate.id,
+                )
+                return DuplicateDecision(
+                    status="duplicate", duplicate_issue=top_duplicate
+                )
+            if top_duplicate.score < self.threshold_low:
+                logger.info(
+                    "HybridDetector: Score %.4f < %.4f. Not a duplicate.",
+                    top_duplicate.score,
+                    self.threshold_low,
+                )
+                return DuplicateDecision(status="not_duplicate")
+
+        return await self.detector.check_duplicates(
+            new_title, new_description, potential_duplicates
+        )
+
 
 # --- Factory ---
 
@@ -227,15 +1078,33 @@ class DuplicateDetectorFactory:
 
         Args:
             client: The OpenAI client instance, needed if OpenAI detector might be used.
+                It should be long-lived (see make_shared_client) so its connection
+                pool is reused across checks.
         """
         self.openai_client = client
+        self._detector: Optional[DuplicateDetector] = None
 
     def get_detector(self) -> DuplicateDetector:
-        """Gets the configured duplicate detector."""
+        """
+        Gets the configured duplicate detector.
+
+        The detector is built on first use and reused afterwards, so configuration
+        is read from the environment once per factory.
+        """
+        if self._detector is None:
+            self._detector = self._create_detector()
+        return self._detector
+
+    def _create_detector(self) -> DuplicateDetector:
+        """Builds the duplicate detector selected by the current configuration."""
         if os.environ.get("OPENAI_API_KEY"):
             if self.openai_client:
-                logger.info("OpenAI API key found. Using OpenAIDuplicateDetector.")
-                return OpenAIDuplicateDetector(client=self.openai_client)
+                llm_detector = self._get_llm_detector()
+                logger.info(
+                    "OpenAI API key found. Using HybridDuplicateDetector over %s.",
+                    type(llm_detector).__name__,
+                )
+                return HybridDuplicateDetector(llm_detector)
             else:
                 # Log warning but still proceed with ThresholdDetector if client is missing
                 logger.warning(
@@ -243,5 +1112,20 @@ class DuplicateDetectorFactory:
                 )
                 return ThresholdDuplicateDetector()
         else:
+            # The key may have been given on the command line rather than in the
+            # environment; a client still lets the detector score candidates.
             logger.info("OpenAI API key not found. Using ThresholdDuplicateDetector.")
-            return ThresholdDuplicateDetector()
+            return ThresholdDuplicateDetector(client=self.openai_client)
+
+    def _get_llm_detector(self) -> OpenAIDuplicateDetector:
+        """Picks the OpenAI detector variant from DUPLICATE_CHECK_STRATEGY and batching config."""
+        strategy = os.environ.get("DUPLICATE_CHECK_STRATEGY", "single").lower()
+        if strategy == "pairwise":
+            return PairwiseOpenAIDuplicateDetector(client=self.openai_client)
+        if strategy != "single":
+            logger.warning(
+                "Unknown DUPLICATE_CHECK_STRATEGY '%s'. Using 'single'.", strategy
+            )
+        if _get_float_env("DUPLICATE_BATCH_WINDOW_MS", 0.0) > 0:
+            return BatchedOpenAIDuplicateDetector(client=self.openai_client)
+        return OpenAIDuplicateDetector(client=self.openai_client)
@@ -0,0 +1,383 @@
+# src/spacebridge_mcp/semantic_cache.py
+"""
+In-memory caches used to skip repeated duplicate-detection work.
+
+Provides an exact-match LRU keyed by a digest of the request, a Bloom filter
+for remembering many keys in little memory, and a semantic cache that matches
+new requests against previously seen ones by cosine similarity of their
+embeddings. Cached embeddings are stored as int8 with a per-vector scale, a
+quarter of the float32 footprint. Semantic caches can be backed by a SQLite
+file so their entries survive restarts.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import operator
+import queue
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+V = TypeVar("V")
+
+logger = logging.getLogger(__name__)
+
+_INSERT_ENTRY = (
+    "INSERT INTO semantic_cache (cache, namespace, vector, scale, value, created) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+def make_key(*parts: str) -> bytes:
+    """Builds a compact digest key from the given string parts."""
+    return hashlib.blake2b("\x00".join(parts).encode("utf-8"), digest_size=16).digest()
+
+
+def normalize(vector: Sequence[float]) -> array:
+    """Returns the L2-normalized copy of a vector as a float32 array."""
+    norm = math.sqrt(math.fsum(x * x for x in vector))
+    if norm == 0.0:
+        return array("f", vector)
+    return array("f", (x / norm for x in vector))
+
+
+def dot(a: Sequence[float], b: Sequence[float]) -> float:
+    """Dot product of two equal-length vectors."""
+    return sum(map(operator.mul, a, b))
+
+
+if hasattr(math, "sumprod"):  # Python 3.12+: one C loop, about twice as fast
+    dot = math.sumprod  # noqa: F811
+
+
+def quantize(vector: Sequence[float]) -> Tuple[array, float]:
+    """
+    Symmetrically quantizes a vector to int8.
+
+    Returns the int8 array and the scale that maps it back to floats, so that
+    dot(qa, qb) * scale_a * scale_b approximates the float dot product.
+    """
+    peak = max(map(abs, vector), default=0.0)
+    if peak == 0.0:
+        return array("b", bytes(len(vector))), 0.0
+    scale = peak / 127.0
+    return array("b", (round(x / scale) for x in vector)), scale
+
+
+class LRUCache(Generic[V]):
+    """A bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, V]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Returns the cached value for key, or None on a miss."""
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Stores value under key, evicting the oldest entry if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Optional[V]:
+        """Removes and returns the value for key, or None if it isn't cached."""
+        return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class BloomFilter:
+    """
+    Probabilistic set of digest keys (as produced by make_key).
+
+    Membership tests may return false positives at roughly error_rate, but never
+    false negatives. The filter is cleared once it holds capacity keys so the
+    false-positive rate stays bounded.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def _positions(self, key: bytes):
+        # Double hashing over the two halves of the (already uniform) digest.
+        h1 = int.from_bytes(key[:8], "little")
+        h2 = int.from_bytes(key[8:16], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, key: bytes) -> None:
+        """Adds a key, starting afresh if the filter is full."""
+        if self._count >= self.capacity:
+            self.clear()
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class SemanticCacheStore:
+    """
+    SQLite-backed persistence for SemanticCache entries.
+
+    Entries of several caches share one database file, told apart by name.
+    Vectors are kept as their int8 bytes plus scale, values as caller-encoded
+    text, along with the time each entry was added. The database runs in WAL
+    mode so a write doesn't wait on a full sync.
+
+    Appends are queued and written by a background thread, so callers (e.g. on
+    the event loop) never wait on disk; entries queued together are committed
+    in one transaction. flush() waits for queued entries to be written.
+    """
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS semantic_cache ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, cache TEXT NOT NULL, "
+                "namespace TEXT NOT NULL, vector BLOB NOT NULL, "
+                "scale REAL NOT NULL, value TEXT NOT NULL, "
+                "created REAL NOT NULL DEFAULT 0)"
+            )
+            columns = {
+                row[1]
+                for row in self._conn.execute("PRAGMA table_info(semantic_cache)")
+            }
+            if "created" not in columns:
+                # Files from before entries were timestamped: treat rows as old.
+                self._conn.execute(
+                    "ALTER TABLE semantic_cache "
+                    "ADD COLUMN created REAL NOT NULL DEFAULT 0"
+                )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS semantic_cache_by_name "
+                "ON semantic_cache (cache, id)"
+            )
+        # Serializes use of the connection by the writer and the caller's thread.
+        self._lock = threading.Lock()
+        self._writes: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_queued, name="semantic-cache-writer", daemon=True
+        )
+        self._writer.start()
+
+    def load(
+        self, cache: str, limit: int
+    ) -> List[Tuple[tuple, array, float, str, float]]:
+        """
+        Returns the most recent entries (at most limit) of the named cache,
+        oldest first. Older entries are deleted, keeping the file bounded.
+        """
+        self.flush()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM semantic_cache WHERE cache = ? AND id NOT IN "
+                "(SELECT id FROM semantic_cache WHERE cache = ? "
+                "ORDER BY id DESC LIMIT ?)",
+                (cache, cache, limit),
+            )
+            rows = self._conn.execute(
+                "SELECT namespace, vector, scale, value, created FROM semantic_cache "
+                "WHERE cache = ? ORDER BY id",
+                (cache,),
+            ).fetchall()
+        return [
+            (tuple(json.loads(namespace)), array("b", vector), scale, value, created)
+            for namespace, vector, scale, value, created in rows
+        ]
+
+    def append(
+        self,
+        cache: str,
+        namespace: tuple,
+        vector: array,
+        scale: float,
+        value: str,
+        created: float,
+    ) -> None:
+        """Queues one entry of the named cache for writing."""
+        self._writes.put(
+            (cache, json.dumps(namespace), vector.tobytes(), scale, value, created)
+        )
+
+    def flush(self) -> None:
+        """Waits until every entry queued so far has been written."""
+        if self._writer.is_alive():
+            self._writes.join()
+
+    def close(self) -> None:
+        """Writes any queued entries, then closes the database."""
+        if self._writer.is_alive():
+            self._writes.put(None)
+            self._writer.join()
+        self._conn.close()
+
+    def _write_queued(self) -> None:
+        """Writer thread: commits queued entries in batches until closed."""
+        while True:
+            rows = [self._writes.get()]
+            while rows[-1] is not None:
+                try:
+                    rows.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+            entries = [row for row in rows if row is not None]
+            try:
+                if entries:
+                    with self._lock, self._conn:
+                        self._conn.executemany(_INSERT_ENTRY, entries)
+            except sqlite3.Error as e:
+                logger.warning("Could not save %s cache entries: %s", len(entries), e)
+            finally:
+                for _ in rows:
+                    self._writes.task_done()
+            if rows[-1] is None:
+                return
+
+
+class SemanticCache(Generic[V]):
+    """
+    Caches values by embedding vector.
+
+    Lookups return the value of the most similar stored vector (cosine
+    similarity) within the same namespace, provided it meets the threshold.
+    Namespaces keep entries that are only valid in a given context (e.g. a
+    specific set of candidate issues) from matching elsewhere; entries are
+    indexed by namespace so a lookup only scores vectors that could match.
+
+    Lookups may run in a worker thread while adds happen on the event loop:
+    a lookup scans a snapshot of the namespace and skips entries evicted
+    meanwhile.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        # Entry ID -> (namespace, vector, scale, value, time added).
+        self._entries: "OrderedDict[int, Tuple[Hashable, array, float, V, float]]" = (
+            OrderedDict()
+        )
+        # Entry IDs of each namespace, in insertion order.
+        self._namespaces: Dict[Hashable, Dict[int, None]] = {}
+        self._next_id = 0
+        self._store: Optional[Tuple[SemanticCacheStore, str, Callable[[V], str]]] = None
+
+    def attach(
+        self,
+        store: SemanticCacheStore,
+        name: str,
+        encode: Callable[[V], str],
+        decode: Callable[[str], V],
+    ) -> int:
+        """
+        Backs the cache with a persistent store, under the given name.
+
+        Loads the most recent stored entries, then writes every later add
+        through to the store. encode and decode convert values to and from
+        text; namespaces must be tuples of JSON-serializable items.
+        Returns the number of entries loaded.
+        """
+        rows = store.load(name, self.maxsize)
+        for namespace, vector, scale, value, created in rows:
+            self._insert((namespace, vector, scale, decode(value), created))
+        self._store = (store, name, encode)
+        return len(rows)
+
+    def lookup(
+        self,
+        vector: Sequence[float],
+        namespace: Hashable,
+        threshold: float,
+        max_age: Optional[float] = None,
+    ) -> Optional[V]:
+        """
+        Returns the best cached value with similarity >= threshold, or None.
+
+        Entries added more than max_age seconds ago (if given) are ignored.
+        """
+        query, query_scale = quantize(normalize(vector))
+        oldest = time.time() - max_age if max_age is not None else -math.inf
+        best = None
+        best_score = threshold
+        entries = self._entries
+        for entry_id in list(self._namespaces.get(namespace, ())):
+            entry = entries.get(entry_id)
+            if entry is None or entry[4] < oldest or len(entry[1]) != len(query):
+                continue
+            score = dot(query, entry[1]) * query_scale * entry[2]
+            if score >= best_score:
+                best, best_score = (entry_id, entry), score
+        if best is None:
+            return None
+        best_id, best_entry = best
+        try:
+            entries.move_to_end(best_id)
+        except KeyError:
+            pass  # Evicted while we were scoring; the value is still valid
+        return best_entry[3]
+
+    def add(self, vector: Sequence[float], value: V, namespace: Hashable) -> None:
+        """Stores value under the given embedding, evicting the oldest entry if full."""
+        quantized, scale = quantize(normalize(vector))
+        created = time.time()
+        self._insert((namespace, quantized, scale, value, created))
+        if self._store is not None:
+            store, name, encode = self._store
+            store.append(name, namespace, quantized, scale, encode(value), created)
+
+    def _insert(self, entry: Tuple[Hashable, array, float, V, float]) -> None:
+        self._entries[self._next_id] = entry
+        self._namespaces.setdefault(entry[0], {})[self._next_id] = None
+        self._next_id += 1
+        if len(self._entries) > self.maxsize:
+            evicted_id, (evicted_namespace, *_) = self._entries.popitem(last=False)
+            ids = self._namespaces[evicted_namespace]
+            del ids[evicted_id]
+            if not ids:
+                del self._namespaces[evicted_namespace]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._namespaces.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
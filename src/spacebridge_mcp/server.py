@@ -4,20 +4,32 @@ Main entry point for the SpaceBridge MCP Server.
 Initializes components and starts the server.
 """
 
+import _thread
+import asyncio
+import atexit
 import os
 import logging
-import configparser
 import re
+import threading
+import time
+import uuid
 import argparse  # Added for command-line arguments
-import openai  # Added for LLM integration
+from functools import lru_cache
 from dotenv import load_dotenv  # Added for .env support
-from packaging.version import parse as parse_version  # Added for version comparison
-import importlib.metadata  # Added to get own version
 from mcp.server.fastmcp.server import FastMCP  # Use FastMCP
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
 # Removed ResourceProvider and get_tools imports
 
 from .spacebridge_client import SpaceBridgeClient
-from .duplicate_detection import DuplicateDetectorFactory
+from .duplicate_detection import (
+    DuplicateDetector,
+    DuplicateDetectorFactory,
+    OpenAIDuplicateDetector,
+    embed_text,
+    issue_text,
+    make_shared_client,
+)
+from .semantic_cache import SemanticCache, SemanticCacheStore, make_key
 
 # Import Pydantic models for tool function signatures
 from .tools import (
@@ -25,7 +37,11 @@ from .tools import (
     CreateIssueOutput,
     UpdateIssueOutput,  # Added update schemas
     IssueSummary,  # Needed for create_issue logic
+    SubCall,
+    SubCallResult,
+    BatchExecuteOutput,
 )
+from pydantic import BaseModel, TypeAdapter
 from typing import (
     List,
     Dict,
@@ -45,27 +61,44 @@ logger = logging.getLogger(__name__)
 # Precedence: Command-line args > Environment variables > .env file
 
 
-def get_config_value(args, env_var_name: str) -> str | None:
+# Environment variables read at startup. main_sync snapshots them once (after
+# load_dotenv) and resolves all configuration from that snapshot.
+CONFIG_ENV_VARS = (
+    "SPACEBRIDGE_API_URL",
+    "SPACEBRIDGE_API_KEY",
+    "OPENAI_API_KEY",
+    "OPENAI_API_BASE",
+    "SPACEBRIDGE_ORG_NAME",
+    "SPACEBRIDGE_PROJECT_NAME",
+)
+# Command-line argument for each setting, e.g. SPACEBRIDGE_API_URL -> spacebridge_api_url
+_CONFIG_ARG_NAMES = {name: name.lower() for name in CONFIG_ENV_VARS}
+
+
+def get_config_value(
+    args, env_var_name: str, env: Dict[str, str | None] | None = None
+) -> str | None:
     """
     Gets a configuration value based on precedence: command-line args, environment variables, .env file.
-    Assumes load_dotenv() has been called.
+    Assumes load_dotenv() has been called. If env is given, environment values are
+    looked up in that snapshot instead of os.environ.
     """
     # Command-line argument (convert env var name to arg name, e.g., SPACEBRIDGE_API_URL -> spacebridge_api_url)
-    arg_name = env_var_name.lower()
+    arg_name = _CONFIG_ARG_NAMES.get(env_var_name) or env_var_name.lower()
     value = getattr(args, arg_name, None)
     if value:
-        logger.debug(f"Using value from command-line argument for {env_var_name}")
+        logger.debug("Using value from command-line argument for %s", env_var_name)
         return value
 
     # Environment variable (which might have been loaded from .env)
-    value = os.getenv(env_var_name)
+    value = env.get(env_var_name) if env is not None else os.getenv(env_var_name)
     if value:
         logger.debug(
-            f"Using value from environment variable (or .env) for {env_var_name}"
+            "Using value from environment variable (or .env) for %s", env_var_name
         )
         return value
 
-    logger.debug(f"No value found for {env_var_name}")
+    logger.debug("No value found for %s", env_var_name)
     return None
 
 
@@ -73,14 +106,231 @@ def get_config_value(args, env_var_name: str) -> str | None:
 spacebridge_client = None
 openai_client = None
 
+# Issues recently matched or created by create_issue, keyed by the embedding of the
+# request and namespaced by (org, project). When enabled, a near-identical request
+# resolves to the same issue without another similarity search or LLM duplicate
+# check. Off by default: distinct reports worded alike would be folded together,
+# and every request would pay for an embedding.
+_recent_create_requests: SemanticCache[IssueSummary] = SemanticCache(maxsize=1024)
+DEFAULT_SEMCACHE_THRESHOLD = 0.0
+DEFAULT_SEMCACHE_MAX_AGE = 24 * 60 * 60  # Seconds
+DEFAULT_BATCH_MAX_CONCURRENCY = 8
+
+# Titles and descriptions shorter than this in total carry too little signal
+# for a similarity search to be worth its round-trip.
+_MIN_SEARCH_TEXT_CHARS = 16
+
+# Validates a whole list of duplicate candidates in one call rather than one model at a time.
+_issue_summaries = TypeAdapter(List[IssueSummary])
+
+# Duplicate searches in flight, keyed by (org, project, query digest), so that
+# concurrent identical create_issue requests share one round-trip.
+_inflight_searches: Dict[tuple, asyncio.Future] = {}
+
+# get_issue lookups in flight, keyed by (issue, org, project), so that a burst of
+# requests for the same issue shares one round-trip.
+_inflight_issue_fetches: Dict[tuple, asyncio.Future] = {}
+
+
+# create_issue requests running in the background (SPACEBRIDGE_ASYNC_CREATE), by
+# job ID, until poll_create_issue collects their outcome. Running jobs are never
+# dropped; finished ones are kept for CREATE_JOB_RESULT_TTL seconds, and
+# _finished_create_jobs records when each finished, oldest first.
+_create_jobs: Dict[str, asyncio.Task] = {}
+_finished_create_jobs: Dict[str, float] = {}
+CREATE_JOB_RESULT_TTL = 60 * 60  # Seconds
+
+# Factory whose detector is shared by create_issue calls (see _get_detector).
+_detector_factory: Optional[DuplicateDetectorFactory] = None
+
+
+def _get_env_number(name: str, default, cast=float, minimum=None):
+    """
+    Reads a numeric env var, falling back to default if unset, invalid or
+    below minimum.
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        number = None
+    if number is None or (minimum is not None and number < minimum):
+        logger.warning(
+            "Invalid value for %s: '%s'. Using default: %s", name, value, default
+        )
+        return default
+    return number
+
+
+def _env_flag(name: str) -> bool:
+    """Reads a boolean env var; 1, true and yes (any case) count as set."""
+    return os.getenv(name, "").lower() in ("1", "true", "yes")
+
+
+def get_semcache_threshold() -> float:
+    """Reads SPACEBRIDGE_SEMCACHE_THRESHOLD (0, the default, disables the cache)."""
+    return _get_env_number("SPACEBRIDGE_SEMCACHE_THRESHOLD", DEFAULT_SEMCACHE_THRESHOLD)
+
+
+def get_semcache_max_age() -> Optional[float]:
+    """
+    Reads SPACEBRIDGE_SEMCACHE_MAX_AGE, the age in seconds beyond which recent
+    create requests are no longer reused (0 means no limit).
+    """
+    max_age = _get_env_number(
+        "SPACEBRIDGE_SEMCACHE_MAX_AGE", DEFAULT_SEMCACHE_MAX_AGE, minimum=0
+    )
+    return max_age or None
+
+
+def _get_detector() -> DuplicateDetector:
+    """
+    Returns the duplicate detector shared across create_issue calls.
+
+    It is built on first use and rebuilt only if openai_client has changed since.
+    """
+    global _detector_factory
+    if (
+        _detector_factory is None
+        or _detector_factory.openai_client is not openai_client
+    ):
+        _detector_factory = DuplicateDetectorFactory(client=openai_client)
+    return _detector_factory.get_detector()
+
+
+def attach_semantic_cache_store(path: str) -> None:
+    """
+    Backs the semantic caches with a SQLite file at path, so that recent create
+    requests and duplicate decisions survive restarts. Failures only disable
+    persistence.
+    """
+    try:
+        store = SemanticCacheStore(path)
+        requests_loaded = _recent_create_requests.attach(
+            store,
+            "create_requests",
+            IssueSummary.model_dump_json,
+            IssueSummary.model_validate_json,
+        )
+        decisions_loaded = OpenAIDuplicateDetector.attach_store(store)
+        atexit.register(store.close)  # Writes entries still queued at shutdown
+    except Exception as e:
+        logger.warning("Could not use semantic cache file '%s': %s", path, e)
+        return
+    logger.info(
+        "Restored %s recent create requests and %s duplicate decisions from %s",
+        requests_loaded,
+        decisions_loaded,
+        path,
+    )
+
+
+def _search_duplicates(
+    client: SpaceBridgeClient,
+    query: str,
+    org_name: Optional[str],
+    project_name: Optional[str],
+) -> asyncio.Future:
+    """
+    Starts a similarity search for duplicate candidates in the background.
+
+    Joins an identical search already in flight instead of starting another.
+    The returned future can be cancelled without affecting other requests
+    waiting on the same search.
+    """
+    return _join_inflight(
+        _inflight_searches,
+        (org_name, project_name, make_key(query)),
+        client.search_issues,
+        query=query,
+        search_type="similarity",
+        org_name=org_name,
+        project_name=project_name,
+    )
+
+
+def _fetch_issue(
+    client: SpaceBridgeClient,
+    issue: str,
+    org_name: Optional[str],
+    project_name: Optional[str],
+) -> asyncio.Future:
+    """Fetches an issue, joining an identical lookup already in flight."""
+    return _join_inflight(
+        _inflight_issue_fetches,
+        (issue, org_name, project_name),
+        client.get_issue,
+        issue,
+        org_name=org_name,
+        project_name=project_name,
+    )
+
+
+def _join_inflight(
+    inflight: Dict[tuple, asyncio.Future], key: tuple, func, *args, **kwargs
+) -> asyncio.Future:
+    """
+    Runs func(*args, **kwargs) in a worker thread, registered in inflight under key.
+
+    If a call with the same key is already running, its result is shared instead.
+    The returned future can be cancelled without affecting other waiters.
+    """
+    call = inflight.get(key)
+    if call is None:
+        call = asyncio.ensure_future(asyncio.to_thread(func, *args, **kwargs))
+        inflight[key] = call
+
+        def _done(finished: asyncio.Future) -> None:
+            inflight.pop(key, None)
+            if not finished.cancelled():
+                finished.exception()  # Retrieved here in case every waiter left
+
+        call.add_done_callback(_done)
+    return asyncio.shield(call)
+
 
 # --- Git Configuration Extraction ---
 
+# Extracts org and repo from the last two path segments of a remote URL. One
+# pattern covers scp-style SSH (git@host:org/repo.git) and every scheme form
+# (https://, ssh://, git://, git+ssh://), with an optional trailing slash.
+_GIT_URL_RE = re.compile(r"[:/](?P<org>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?/?$")
+
+
+@lru_cache(maxsize=4)
+def _read_remote_url(git_config_path: str, mtime: float) -> str | None:
+    """
+    Returns the remote url from a git config file, or None.
+
+    The url of [remote "origin"] is preferred; without one, the first url of
+    any other remote (e.g. "upstream") is used. Scans lines once and stops at
+    the origin url instead of parsing the whole file. Results are cached per
+    absolute path; mtime is part of the cache key so edits are picked up.
+    """
+    section = None
+    first_remote_url = None
+    with open(git_config_path, encoding="utf-8") as config_file:
+        for line in config_file:
+            line = line.strip()
+            if line.startswith("["):
+                section = line
+            elif section is not None and section.startswith('[remote "'):
+                key, sep, value = line.partition("=")
+                if sep and key.strip().lower() == "url":
+                    url = value.strip().strip('"')
+                    if section == '[remote "origin"]':
+                        return url
+                    if first_remote_url is None:
+                        first_remote_url = url
+    return first_remote_url
+
 
 def get_git_info(git_config_path=".git/config") -> tuple[str | None, str | None]:
     """
     Reads the .git/config file and extracts organization and project name
-    from the remote 'origin' URL.
+    from the remote 'origin' URL (or the first other remote if there is no origin).
 
     Returns:
         A tuple (org_name, project_name), or (None, None) if not found or error.
@@ -89,36 +339,33 @@ def get_git_info(git_config_path=".git/config") -> tuple[str | None, str | None]
     project_name = None
     try:
         if not os.path.exists(git_config_path):
-            logger.warning(f"Git config file not found at: {git_config_path}")
+            logger.warning("Git config file not found at: %s", git_config_path)
             return None, None
 
-        config = configparser.ConfigParser()
-        config.read(git_config_path)
+        config_path = os.path.abspath(git_config_path)
+        remote_url = _read_remote_url(config_path, os.path.getmtime(config_path))
 
-        remote_origin_url = config.get('remote "origin"', "url", fallback=None)
-
-        if remote_origin_url:
-            # Try to match common Git URL patterns (SSH and HTTPS)
+        if remote_url:
             # Example SSH: git@github.com:org/repo.git
             # Example HTTPS: https://github.com/org/repo.git
-            match = re.search(r"(?:[:/])([^/]+)/([^/]+?)(?:\.git)?$", remote_origin_url)
+            match = _GIT_URL_RE.search(remote_url)
             if match:
-                org_name = match.group(1)
-                project_name = match.group(2)
+                org_name = match.group("org")
+                project_name = match.group("repo")
                 logger.info(
-                    f"Extracted Git info: Org='{org_name}', Project='{project_name}'"
+                    "Extracted Git info: Org='%s', Project='%s'", org_name, project_name
                 )
             else:
                 logger.warning(
-                    f"Could not parse org/project from remote URL: {remote_origin_url}"
+                    "Could not parse org/project from remote URL: %s", remote_url
                 )
         else:
-            logger.warning("Remote 'origin' URL not found in git config.")
+            logger.warning("No remote URL found in git config.")
 
-    except configparser.Error as e:
-        logger.error(f"Error parsing git config file '{git_config_path}': {e}")
+    except OSError as e:
+        logger.error("Error reading git config file '%s': %s", git_config_path, e)
     except Exception as e:
-        logger.error(f"Unexpected error reading git config: {e}", exc_info=True)
+        logger.error("Unexpected error reading git config: %s", e, exc_info=True)
 
     return org_name, project_name
 
@@ -136,6 +383,8 @@ app = FastMCP(
 )
 
 # --- Define Tool Handlers ---
+# SpaceBridgeClient is synchronous (requests), so handlers run its calls in a worker
+# thread via asyncio.to_thread to keep the event loop free for concurrent requests.
 
 
 # TODO: Change this back to an MCP resource handler when there is wider client support for MCP resources.
@@ -149,19 +398,20 @@ async def get_issue_tool_handler(
     """
     Handles requests for retrieving a specific issue by its ID/key from SpaceBridge.
     """
-    logger.info(f"Received tool request for get_issue: {issue}")
+    logger.info("Received tool request for get_issue: %s", issue)
     try:
         # Use the globally initialized client
         # The client method might still use org_name/project_name for context if needed internally
-        issue_data = spacebridge_client.get_issue(
-            issue, org_name=org_name, project_name=project
-        )
+        # Concurrent requests for the same issue share one lookup
+        issue_data = await _fetch_issue(spacebridge_client, issue, org_name, project)
 
         # Return the raw issue data dictionary
-        logger.info(f"Successfully retrieved issue data for {issue}")
+        logger.info("Successfully retrieved issue data for %s", issue)
         return issue_data
     except Exception as e:
-        logger.error(f"Error processing tool request for {issue}: {e}", exc_info=True)
+        logger.error(
+            "Error processing tool request for %s: %s", issue, e, exc_info=True
+        )
         raise
 
 
@@ -181,28 +431,32 @@ async def search_issues_handler(
 ) -> SearchIssuesOutput:
     """Implements the 'search_issues' tool using FastMCP."""
     logger.info(
-        f"Executing tool 'search_issues' with query: '{query}', type: {search_type}, "
-        f"org: {org}, project: {project}, status: {status}, labels: {labels}, "
-        f"assignee: {assignee}, priority: {priority}"
+        "Executing tool 'search_issues' with query: '%s', type: %s, "
+        "org: %s, project: %s, status: %s, labels: %s, "
+        "assignee: %s, priority: %s",
+        query,
+        search_type,
+        org,
+        project,
+        status,
+        labels,
+        assignee,
+        priority,
     )
+    client = spacebridge_client  # Read the global once per call
     try:
         # Determine final context (Startup context takes priority)
-        final_org = (
-            spacebridge_client.org_name
-            if spacebridge_client.org_name is not None
-            else org
-        )
+        final_org = client.org_name if client.org_name is not None else org
         final_project = (
-            spacebridge_client.project_name
-            if spacebridge_client.project_name is not None
-            else project
+            client.project_name if client.project_name is not None else project
         )
         logger.debug(
-            f"Search using context: Org='{final_org}', Project='{final_project}'"
+            "Search using context: Org='%s', Project='%s'", final_org, final_project
         )
 
         # Use the globally initialized client, passing the determined context
-        search_results_raw = spacebridge_client.search_issues(
+        search_results_raw = await asyncio.to_thread(
+            client.search_issues,
             query=query,
             search_type=search_type,
             org_name=final_org,  # Pass final context
@@ -213,17 +467,15 @@ async def search_issues_handler(
             priority=priority,  # Pass filter
         )
 
-        # Format results into the output schema
-        # Ensure the raw results match the IssueSummary model structure
-        output_data = SearchIssuesOutput(
-            results=[IssueSummary(**result) for result in search_results_raw]
-        )
+        # Format results into the output schema, validating the raw results
+        # against the IssueSummary model structure in a single pass
+        output_data = SearchIssuesOutput.model_validate({"results": search_results_raw})
 
         logger.info("Tool 'search_issues' completed successfully.")
         return output_data
 
     except Exception as e:
-        logger.error(f"Error executing tool 'search_issues': {e}", exc_info=True)
+        logger.error("Error executing tool 'search_issues': %s", e, exc_info=True)
         # TODO: Raise specific FastMCP tool error?
         raise  # Let FastMCP handle the error reporting
 
@@ -247,56 +499,186 @@ async def create_issue_handler(
     Implements the 'create_issue' tool using FastMCP.
     Includes modular duplicate detection.
     Uses tool parameters first, then startup context as fallback for org/project.
+
+    With SPACEBRIDGE_ASYNC_CREATE set, a request with similarity search runs in
+    the background and a 'pending' result with a job_id is returned at once;
+    the outcome is then collected with poll_create_issue.
+    """
+    args = dict(
+        title=title,
+        description=description,
+        org=org,
+        project=project,
+        labels=labels,
+        assignee=assignee,
+        priority=priority,
+        status=status,
+        similarity_search=similarity_search,
+    )
+    if not (similarity_search and _env_flag("SPACEBRIDGE_ASYNC_CREATE")):
+        return await _create_issue(**args)
+
+    _prune_create_jobs()
+    job_id = uuid.uuid4().hex
+    job = asyncio.create_task(_create_issue(**args))
+    _create_jobs[job_id] = job
+
+    def _finished(finished: asyncio.Task) -> None:
+        _finished_create_jobs[job_id] = time.monotonic()
+        if not finished.cancelled():
+            finished.exception()  # Reported by poll_create_issue, or already logged
+
+    job.add_done_callback(_finished)
+    logger.info("Tool 'create_issue' started as job %s.", job_id)
+    return CreateIssueOutput(
+        status="pending",
+        message="Checking for duplicates. Call poll_create_issue with the job_id for the outcome.",
+        job_id=job_id,
+    )
+
+
+@app.tool(
+    name="poll_create_issue",
+    description="Returns the outcome of a create_issue call that returned status 'pending', given its job_id. Returns 'pending' again while the job is still running.",
+)
+async def poll_create_issue_handler(job_id: str) -> CreateIssueOutput:
+    """
+    Implements the 'poll_create_issue' tool using FastMCP.
+    A finished job's outcome (or error) is returned once, then the job is forgotten.
     """
+    job = _create_jobs.get(job_id)
+    if job is None:
+        raise ValueError(f"Unknown or already collected create_issue job: {job_id}")
+    if not job.done():
+        return CreateIssueOutput(
+            status="pending",
+            message="Still checking for duplicates. Poll again shortly.",
+            job_id=job_id,
+        )
+    _create_jobs.pop(job_id, None)
+    _finished_create_jobs.pop(job_id, None)
+    return job.result()  # Re-raises the job's error, if it failed
+
+
+def _prune_create_jobs() -> None:
+    """Forgets finished jobs whose outcome went uncollected for CREATE_JOB_RESULT_TTL."""
+    expired_before = time.monotonic() - CREATE_JOB_RESULT_TTL
+    for job_id, finished_at in list(_finished_create_jobs.items()):
+        if finished_at >= expired_before:
+            break  # Finished in order, so the rest are newer
+        del _finished_create_jobs[job_id]
+        _create_jobs.pop(job_id, None)
+
+
+async def _create_issue(
+    title: str,
+    description: str,
+    org: Optional[str],
+    project: Optional[str],
+    labels: Optional[List[str]],
+    assignee: Optional[str],
+    priority: Optional[str],
+    status: Optional[str],
+    similarity_search: Optional[bool],
+) -> CreateIssueOutput:
+    """Runs a create_issue request: duplicate check, then creation if needed."""
     logger.info(
-        f"Executing tool 'create_issue' for title: '{title}', "
-        f"org: {org}, project: {project}, labels: {labels}"
+        "Executing tool 'create_issue' for title: '%s', "
+        "org: %s, project: %s, labels: %s",
+        title,
+        org,
+        project,
+        labels,
     )
+    # Read the globals once per call: the same clients serve the whole request
+    client, llm_client = spacebridge_client, openai_client
     try:
         # Determine final context (Tool arguments take priority)
-        final_org = org or spacebridge_client.org_name
-        final_project = project or spacebridge_client.project_name
+        final_org = org or client.org_name
+        final_project = project or client.project_name
         logger.debug(
-            f"Create using context: Org='{final_org}', Project='{final_project}'"
+            "Create using context: Org='%s', Project='%s'", final_org, final_project
         )
 
-        combined_text = f"{title}\n\n{description}"
-        output_data = None
+        combined_text = issue_text(title, description)
+        if (
+            similarity_search
+            and len(title.strip()) + len(description.strip()) < _MIN_SEARCH_TEXT_CHARS
+        ):
+            logger.info("Skipping duplicate search: title and description too short.")
+            similarity_search = False
+        duplicate_decision = None
+        request_embedding = None
+        request_namespace = (final_org, final_project)
         if similarity_search:
-            # 1. Search for potential duplicates using final context
-            logger.info(f"Searching for potential duplicates for: '{title}'")
+            # 1. Search for potential duplicates using final context, in the background
+            logger.info("Searching for potential duplicates for: '%s'", title)
+            search_task = _search_duplicates(
+                client, combined_text, final_org, final_project
+            )
+
+            # 1a. Meanwhile, reuse the outcome of a recent near-identical request, if any
+            recent_issue = None
+            try:
+                semcache_threshold = get_semcache_threshold()
+                if llm_client is not None and semcache_threshold > 0:
+                    request_embedding = await embed_text(llm_client, combined_text)
+                    if request_embedding:
+                        # Scoring a full namespace takes tens of milliseconds, so
+                        # keep it off the event loop.
+                        recent_issue = await asyncio.to_thread(
+                            _recent_create_requests.lookup,
+                            request_embedding,
+                            request_namespace,
+                            semcache_threshold,
+                            get_semcache_max_age(),
+                        )
+            except BaseException:
+                # Don't leave the search running if the request is cancelled or fails here
+                search_task.cancel()
+                raise
+            if recent_issue is not None:
+                search_task.cancel()  # Result no longer needed
+                logger.info(
+                    "Tool 'create_issue' completed (matched recent request for issue: %s).",
+                    recent_issue.id,
+                )
+                return CreateIssueOutput(
+                    issue_id=recent_issue.id,
+                    status="existing_duplicate_found",
+                    message=f"Duplicate detection determined this is a likely duplicate of issue {recent_issue.id}.",
+                    url=recent_issue.url,
+                )
+
+            detector = _get_detector()
             potential_duplicates: List[IssueSummary] = []
             search_failed = False
             try:
-                potential_duplicates_raw = spacebridge_client.search_issues(
-                    query=combined_text,
-                    search_type="similarity",
-                    org_name=final_org,
-                    project_name=final_project,
+                potential_duplicates_raw = await search_task
+                logger.info(
+                    "Found %s potential duplicates.", len(potential_duplicates_raw)
+                )
+                # Ensure raw data is converted to IssueSummary objects, skipping
+                # results beyond the ones the detector will look at
+                potential_duplicates = _issue_summaries.validate_python(
+                    [
+                        dup
+                        for dup in potential_duplicates_raw[: detector.max_candidates]
+                        if isinstance(dup, dict)
+                    ]
                 )
-                # Ensure raw data is converted to IssueSummary objects
-                potential_duplicates = [
-                    IssueSummary(**dup)
-                    for dup in potential_duplicates_raw
-                    if isinstance(dup, dict)
-                ]
-                logger.info(f"Found {len(potential_duplicates)} potential duplicates.")
             except Exception as search_error:
                 search_failed = True
                 logger.warning(
-                    f"Similarity search failed during duplicate check: {search_error}. "
-                    f"Proceeding with creation without duplicate check."
+                    "Similarity search failed during duplicate check: %s. "
+                    "Proceeding with creation without duplicate check.",
+                    search_error,
                 )
                 # Continue without duplicate check if search fails
 
             # 2. Perform Duplicate Check using the appropriate strategy
-            duplicate_decision = None
             # Only run detector if search didn't fail AND found potential duplicates
             if not search_failed and potential_duplicates:
-                # Instantiate factory (pass openai_client if needed)
-                # Assuming openai_client is available in this scope and imported
-                factory = DuplicateDetectorFactory(client=openai_client)
-                detector = factory.get_detector()
                 try:
                     duplicate_decision = await detector.check_duplicates(
                         new_title=title,
@@ -304,38 +686,40 @@ async def create_issue_handler(
                         potential_duplicates=potential_duplicates,
                     )
                     logger.info(
-                        f"Duplicate check decision: {duplicate_decision.status}"
+                        "Duplicate check decision: %s", duplicate_decision.status
                     )
                 except Exception as detector_error:
                     logger.error(
-                        f"Error during duplicate detection: {detector_error}",
+                        "Error during duplicate detection: %s",
+                        detector_error,
                         exc_info=True,
                     )
                     # If detector fails, treat as undetermined to be safe and create issue
                     # Setting decision to None ensures creation block runs
                     duplicate_decision = None
 
-            # 3. Create or return duplicate info based on decision
-            output_data = None
+            # 3. Return duplicate info if the detector confirmed one
             if duplicate_decision and duplicate_decision.status == "duplicate":
                 dup_issue = duplicate_decision.duplicate_issue
                 if dup_issue:
-                    output_data = CreateIssueOutput(
+                    if request_embedding:
+                        _recent_create_requests.add(
+                            request_embedding, dup_issue, request_namespace
+                        )
+                    logger.info(
+                        "Tool 'create_issue' completed (found duplicate: %s).",
+                        dup_issue.id,
+                    )
+                    return CreateIssueOutput(
                         issue_id=dup_issue.id,
                         status="existing_duplicate_found",
                         message=f"Duplicate detection determined this is a likely duplicate of issue {dup_issue.id}.",
                         url=dup_issue.url,
                     )
-                    logger.info(
-                        f"Tool 'create_issue' completed (found duplicate: {dup_issue.id})."
-                    )
-                else:
-                    # This case indicates an internal logic error in the detector
-                    logger.error(
-                        "Duplicate status returned without duplicate issue details. Proceeding with creation."
-                    )
-                    # Fallback to creating a new issue by setting output_data back to None
-                    output_data = None  # Force creation block to run
+                # This case indicates an internal logic error in the detector
+                logger.error(
+                    "Duplicate status returned without duplicate issue details. Proceeding with creation."
+                )
 
         # Create issue if:
         # - No potential duplicates were found initially
@@ -343,50 +727,58 @@ async def create_issue_handler(
         # - Duplicate detector failed
         # - Duplicate detector decided 'not_duplicate'
         # - Duplicate detector decided 'undetermined'
-        # - Duplicate detector decided 'duplicate' but failed to provide details (handled above)
-        if (
-            output_data is None
-        ):  # Checks if output_data wasn't set in the duplicate block
-            action = (
-                "Creating new issue"
-                if not duplicate_decision
-                else f"Creating new issue (detector status: {duplicate_decision.status})"
+        # - Duplicate detector decided 'duplicate' but failed to provide details (logged above)
+        action = (
+            "Creating new issue"
+            if not duplicate_decision
+            else f"Creating new issue (detector status: {duplicate_decision.status})"
+        )
+        logger.info("%s...", action)
+        try:
+            created_issue_data = await asyncio.to_thread(
+                client.create_issue,
+                title=title,
+                description=description,
+                org_name=final_org,
+                project_name=final_project,
+                labels=labels,
             )
-            logger.info(f"{action}...")
-            try:
-                created_issue_data = spacebridge_client.create_issue(
-                    title=title,
-                    description=description,
-                    org_name=final_org,
-                    project_name=final_project,
-                    labels=labels,
-                )
-                # Handle potential missing keys from API response defensively
-                created_id = created_issue_data.get("id", "UNKNOWN")
-                created_url = created_issue_data.get("url")
-                output_data = CreateIssueOutput(
-                    issue_id=created_id,
-                    status="created",
-                    message="Successfully created new issue.",
-                    url=created_url,
+            # Handle potential missing keys from API response defensively
+            created_id = created_issue_data.get("id", "UNKNOWN")
+            created_url = created_issue_data.get("url")
+            if request_embedding and created_id != "UNKNOWN":
+                _recent_create_requests.add(
+                    request_embedding,
+                    IssueSummary(
+                        id=created_id,
+                        title=title,
+                        description=description,
+                        url=created_url,
+                    ),
+                    request_namespace,
                 )
-                logger.info(
-                    f"Tool 'create_issue' completed (created new issue: {created_id})."
-                )
-            except Exception as create_error:
-                logger.error(
-                    f"Failed to create issue after duplicate check: {create_error}",
-                    exc_info=True,
-                )
-                # Re-raising seems appropriate for FastMCP handler.
-                raise create_error
-
-        return output_data
+            logger.info(
+                "Tool 'create_issue' completed (created new issue: %s).", created_id
+            )
+            return CreateIssueOutput(
+                issue_id=created_id,
+                status="created",
+                message="Successfully created new issue.",
+                url=created_url,
+            )
+        except Exception as create_error:
+            logger.error(
+                "Failed to create issue after duplicate check: %s",
+                create_error,
+                exc_info=True,
+            )
+            # Re-raising seems appropriate for FastMCP handler.
+            raise create_error
 
     except Exception as e:
         # Log the error before re-raising to ensure it's captured
         logger.error(
-            f"Unhandled error executing tool 'create_issue': {e}", exc_info=True
+            "Unhandled error executing tool 'create_issue': %s", e, exc_info=True
         )
         raise  # Let FastMCP handle the final error reporting
 
@@ -408,23 +800,27 @@ async def update_issue_handler(
     Implements the 'update_issue' tool using FastMCP, aligning with the PUT /issues/issues/{issue} endpoint.
     Org/Project context is not needed for the update API call itself.
     """
-    logger.info(f"Executing tool 'update_issue' for issue: {issue}")
+    logger.info("Executing tool 'update_issue' for issue: %s", issue)
     try:
-        # Prepare the update payload based on provided arguments, aligning with IssueUpdate schema
-        update_args = {
-            "title": title,
-            "description": description,
-            "status": status,
-            "priority": priority,
-            "assignee": assignee,
-            "labels": labels,
+        # Prepare the update payload based on provided arguments, aligning with IssueUpdate schema.
+        # Only provided (non-None) fields are added, without an intermediate dict.
+        update_payload = {}
+        for field, value in (
+            ("title", title),
+            ("description", description),
+            ("status", status),
+            ("priority", priority),
+            ("assignee", assignee),
+            ("labels", labels),
             # Add 'metadata' if needed in the future
-        }
-        # Filter out None values explicitly so only provided fields are sent
-        update_payload = {k: v for k, v in update_args.items() if v is not None}
+        ):
+            if value is not None:
+                update_payload[field] = value
 
         if not update_payload:
-            logger.warning(f"Update issue called for {issue} with no fields to update.")
+            logger.warning(
+                "Update issue called for %s with no fields to update.", issue
+            )
             return UpdateIssueOutput(
                 issue_id=issue,  # Use the input identifier
                 status="failed",
@@ -432,11 +828,12 @@ async def update_issue_handler(
                 url=None,
             )
 
-        logger.debug(f"Update payload for issue {issue}: {update_payload}")
+        logger.debug("Update payload for issue %s: %s", issue, update_payload)
 
         # Use the globally initialized client
         # The client method should only require the issue identifier and the payload
-        updated_issue_data = spacebridge_client.update_issue(
+        updated_issue_data = await asyncio.to_thread(
+            spacebridge_client.update_issue,
             issue=issue,  # Pass the issue identifier (ID or key)
             **update_payload,  # Pass filtered fields as keyword arguments
         )
@@ -451,12 +848,12 @@ async def update_issue_handler(
             message=f"Successfully updated issue {issue}.",  # Log original identifier used
             url=updated_issue_data.get("url"),
         )
-        logger.info(f"Tool 'update_issue' completed successfully for {issue}.")
+        logger.info("Tool 'update_issue' completed successfully for %s.", issue)
         return output_data
 
     except Exception as e:
         logger.error(
-            f"Error executing tool 'update_issue' for {issue}: {e}", exc_info=True
+            "Error executing tool 'update_issue' for %s: %s", issue, e, exc_info=True
         )
         # Return a failed output
         return UpdateIssueOutput(
@@ -469,26 +866,92 @@ async def update_issue_handler(
         # raise
 
 
-# --- Main execution logic moved to main_sync ---
-# The async main function is no longer needed with FastMCP's run method
+# Tools that write to SpaceBridge. Timing one out would only stop waiting for it
+# while its worker thread carries on, so a caller retrying the "failed" call
+# could create a second issue; batch_execute lets them run to completion.
+_MUTATING_TOOLS = frozenset({"create_issue", "update_issue"})
 
 
-def main_sync():
-    """Parses arguments, loads config, initializes clients, performs version check, and runs the FastMCP server."""
+@lru_cache(maxsize=1)
+def _batch_handlers() -> Dict[str, tuple]:
+    """Maps each batchable tool to its handler and FastMCP argument metadata."""
+    handlers = {
+        "get_issue": get_issue_tool_handler,
+        "search_issues": search_issues_handler,
+        "create_issue": create_issue_handler,
+        "update_issue": update_issue_handler,
+    }
+    return {name: (fn, func_metadata(fn)) for name, fn in handlers.items()}
 
-    # 1. Load .env file first (if it exists) - values can be overridden by env vars or args
-    dotenv_path = os.path.join(os.getcwd(), ".env")
-    if os.path.exists(dotenv_path):
-        logger.info(f"Loading environment variables from: {dotenv_path}")
-        load_dotenv(
-            dotenv_path=dotenv_path, override=False
-        )  # override=False ensures env vars take precedence over .env
-    else:
-        logger.info(
-            ".env file not found, relying on environment variables and command-line arguments."
+
+@app.tool(
+    name="batch_execute",
+    description="Runs several get_issue, search_issues, create_issue or update_issue calls in one request, concurrently. Results are returned in the same order as the calls.",
+)
+async def batch_execute_handler(calls: List[SubCall]) -> BatchExecuteOutput:
+    """
+    Implements the 'batch_execute' tool using FastMCP.
+    Dispatches each sub-call to its tool handler, at most
+    SPACEBRIDGE_BATCH_MAX_CONCURRENCY at a time, validating its arguments as
+    for a direct call. A failing or timed-out sub-call is reported in its
+    result and does not affect the others. Calls that write to SpaceBridge
+    are not subject to timeout_ms (see _MUTATING_TOOLS).
+    """
+    logger.info("Executing tool 'batch_execute' with %s calls", len(calls))
+    handlers = _batch_handlers()
+    semaphore = asyncio.Semaphore(
+        _get_env_number(
+            "SPACEBRIDGE_BATCH_MAX_CONCURRENCY",
+            DEFAULT_BATCH_MAX_CONCURRENCY,
+            int,
+            minimum=1,
         )
+    )
+
+    async def run(call: SubCall):
+        handler, metadata = handlers[call.tool]
+        unknown = set(call.args) - set(metadata.arg_model.model_fields)
+        if unknown:
+            raise ValueError(
+                f"Unknown argument(s) for {call.tool}: {', '.join(sorted(unknown))}"
+            )
+        async with semaphore:
+            invocation = metadata.call_fn_with_arg_validation(
+                handler, True, call.args, None
+            )
+            if call.tool in _MUTATING_TOOLS or not call.timeout_ms:
+                return await invocation
+            return await asyncio.wait_for(invocation, call.timeout_ms / 1000)
 
-    # 2. Set up argument parser
+    outcomes = await asyncio.gather(
+        *(run(call) for call in calls), return_exceptions=True
+    )
+
+    results = []
+    for call, outcome in zip(calls, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning("Batched '%s' call failed: %r", call.tool, outcome)
+            results.append(
+                SubCallResult(
+                    tool=call.tool,
+                    status="error",
+                    error=f"{type(outcome).__name__}: {outcome}",
+                )
+            )
+        else:
+            if isinstance(outcome, BaseModel):
+                outcome = outcome.model_dump()
+            results.append(SubCallResult(tool=call.tool, status="ok", result=outcome))
+    return BatchExecuteOutput(results=results)
+
+
+# --- Main execution logic moved to main_sync ---
+# The async main function is no longer needed with FastMCP's run method
+
+
+@lru_cache(maxsize=1)
+def _get_arg_parser() -> argparse.ArgumentParser:
+    """Builds the command-line parser on first use and reuses it afterwards."""
     parser = argparse.ArgumentParser(description="Run the SpaceBridge MCP Server.")
     parser.add_argument(
         "--spacebridge-api-url",
@@ -515,15 +978,54 @@ def main_sync():
         help="Explicitly set the project name (overrides env var and Git detection)",
     )
     # Add other arguments as needed (e.g., --log-level)
+    return parser
+
 
+def _startup_context(
+    args, arg_name: str, env_var_name: str, env: Dict[str, str | None], label: str
+) -> str | None:
+    """Returns an org/project context value from the command line, else from env."""
+    value = getattr(args, arg_name, None)
+    source = "command-line argument"
+    if not value:
+        value = env[env_var_name]
+        source = f"{env_var_name} env var"
+    if not value:
+        return None
+    logger.info("Using %s from %s: %s", label, source, value)
+    return value
+
+
+def main_sync():
+    """Parses arguments, loads config, initializes clients, performs version check, and runs the FastMCP server."""
+
+    cwd = os.getcwd()
+
+    # 1. Load .env file first (if it exists) - values can be overridden by env vars or args
+    dotenv_path = os.path.join(cwd, ".env")
+    if _env_flag("SPACEBRIDGE_SKIP_DOTENV"):
+        logger.info("SPACEBRIDGE_SKIP_DOTENV is set, not looking for a .env file.")
+    elif os.path.exists(dotenv_path):
+        logger.info("Loading environment variables from: %s", dotenv_path)
+        load_dotenv(
+            dotenv_path=dotenv_path, override=False
+        )  # override=False ensures env vars take precedence over .env
+    else:
+        logger.info(
+            ".env file not found, relying on environment variables and command-line arguments."
+        )
+
+    # 2. Parse command-line arguments
+    parser = _get_arg_parser()
     args = parser.parse_args()
 
     # 3. Determine final configuration values using precedence
     # Note: get_config_value already implements Command-line > Environment variable precedence
     # Since load_dotenv(override=False) was used, Environment variable > .env file is also handled.
-    final_api_url = get_config_value(args, "SPACEBRIDGE_API_URL")
-    final_api_key = get_config_value(args, "SPACEBRIDGE_API_KEY")
-    final_openai_key = get_config_value(args, "OPENAI_API_KEY")
+    env = {name: os.getenv(name) for name in CONFIG_ENV_VARS}
+    final_api_url = get_config_value(args, "SPACEBRIDGE_API_URL", env)
+    final_api_key = get_config_value(args, "SPACEBRIDGE_API_KEY", env)
+    final_openai_key = get_config_value(args, "OPENAI_API_KEY", env)
 
     # 4. Validate required configuration
     missing_config = []
@@ -548,60 +1050,42 @@ def main_sync():
     # 5. Initialize clients using final configuration
     global spacebridge_client, openai_client  # Need globals as handlers access these
     try:
-        # Determine startup org and project context based on precedence
-        startup_org_name = None
-        startup_project_name = None
-
-        # 1. Command-line arguments
-        if getattr(args, "org_name", None):
-            startup_org_name = args.org_name
-            logger.info(
-                f"Using organization name from command-line argument: {startup_org_name}"
-            )
-        if getattr(args, "project_name", None):
-            startup_project_name = args.project_name
-            logger.info(
-                f"Using project name from command-line argument: {startup_project_name}"
-            )
-
-        # 2. Environment variables (only if not set by args)
-        if startup_org_name is None:
-            env_org = os.getenv("SPACEBRIDGE_ORG_NAME")
-            if env_org:
-                startup_org_name = env_org
-                logger.info(
-                    f"Using organization name from SPACEBRIDGE_ORG_NAME env var: {startup_org_name}"
-                )
-        if startup_project_name is None:
-            env_project = os.getenv("SPACEBRIDGE_PROJECT_NAME")
-            if env_project:
-                startup_project_name = env_project
-                logger.info(
-                    f"Using project name from SPACEBRIDGE_PROJECT_NAME env var: {startup_project_name}"
-                )
+        # Determine startup org and project context based on precedence:
+        # 1. Command-line arguments, 2. Environment variables, 3. Git detection
+        startup_org_name = _startup_context(
+            args, "org_name", "SPACEBRIDGE_ORG_NAME", env, "organization name"
+        )
+        startup_project_name = _startup_context(
+            args, "project_name", "SPACEBRIDGE_PROJECT_NAME", env, "project name"
+        )
 
         # 3. Git detection (--project-dir or CWD) (only if not set by args or env vars)
-        if startup_org_name is None or startup_project_name is None:
+        missing_context = startup_org_name is None or startup_project_name is None
+        if missing_context and _env_flag("SPACEBRIDGE_SKIP_GIT_DETECT"):
+            logger.info("SPACEBRIDGE_SKIP_GIT_DETECT is set, skipping Git detection.")
+        elif missing_context:
             project_dir_arg = getattr(args, "project_dir", None)
-            git_config_dir = project_dir_arg or os.getcwd()
+            git_config_dir = project_dir_arg or cwd
             git_config_path = os.path.join(git_config_dir, ".git/config")
-            logger.info(f"Attempting Git context detection from: {git_config_path}")
+            logger.info("Attempting Git context detection from: %s", git_config_path)
             detected_org, detected_project = get_git_info(git_config_path)
 
             if startup_org_name is None and detected_org:
                 startup_org_name = detected_org
                 logger.info(
-                    f"Using organization name from Git detection: {startup_org_name}"
+                    "Using organization name from Git detection: %s", startup_org_name
                 )
             if startup_project_name is None and detected_project:
                 startup_project_name = detected_project
                 logger.info(
-                    f"Using project name from Git detection: {startup_project_name}"
+                    "Using project name from Git detection: %s", startup_project_name
                 )
 
         # Log final determined context
         logger.info(
-            f"Final startup context: Org='{startup_org_name}', Project='{startup_project_name}'"
+            "Final startup context: Org='%s', Project='%s'",
+            startup_org_name,
+            startup_project_name,
         )
 
         logger.info("Initializing SpaceBridgeClient...")
@@ -612,60 +1096,114 @@ def main_sync():
             project_name=startup_project_name,  # Use determined startup context
         )
         logger.info("Initializing OpenAI Client...")
-        # Prepare OpenAI client parameters
-        openai_params = {"api_key": final_openai_key}
-        openai_api_base = os.environ.get("OPENAI_API_BASE")
+        openai_api_base = env["OPENAI_API_BASE"]
         if openai_api_base:
-            logger.info(f"Using custom OpenAI API URL: {openai_api_base}")
-            openai_params["base_url"] = openai_api_base
+            logger.info("Using custom OpenAI API URL: %s", openai_api_base)
 
-        openai_client = openai.AsyncOpenAI(**openai_params)
+        openai_client = make_shared_client(final_openai_key, base_url=openai_api_base)
+        _get_detector()  # Built now so the first create_issue call doesn't pay for it
         logger.info("Clients initialized successfully.")
 
-        # 5a. Perform version check after client initialization
-        if not perform_version_check(spacebridge_client):
-            return  # Exit if version check fails critically (e.g., client too old)
+        # 5a. Check version compatibility in the background, so startup doesn't
+        # wait on the API round-trip; the server stops if the client is too old.
+        # The check also warms the client's connection pool for the first tool call.
+        threading.Thread(
+            target=_run_version_check,
+            args=(spacebridge_client,),
+            name="spacebridge-version-check",
+            daemon=True,
+        ).start()
+
+        # 5b. Restore semantic caches from earlier runs, if persistence is enabled
+        semcache_path = os.getenv("SPACEBRIDGE_SEMCACHE_PATH")
+        if semcache_path:
+            attach_semantic_cache_store(semcache_path)
 
     except ValueError as e:
-        logger.error(f"Client Initialization Error: {e}")
+        logger.error("Client Initialization Error: %s", e)
         print(f"Error: Client Initialization Error: {e}")
         return  # Exit if clients can't be initialized
     except Exception as e:
         logger.error(
-            f"Unexpected error during client initialization: {e}", exc_info=True
+            "Unexpected error during client initialization: %s", e, exc_info=True
         )
         print(f"Error: Unexpected error during client initialization: {e}")
         return
 
-    # 6. Start the server
-    logger.info(f"Starting FastMCP server (PID: {os.getpid()})...")
+    # 6. Start the server, unless the version check has already rejected this client
+    global _serving
     try:
-        # Run the FastMCP app
-        app.run()  # Uses stdio transport by default
+        with _version_check_lock:
+            _serving = not _version_rejected.is_set()
+        if _serving:
+            logger.info("Starting FastMCP server (PID: %s)...", os.getpid())
+            # Run the FastMCP app
+            app.run()  # Uses stdio transport by default
     except KeyboardInterrupt:
-        logger.info("Server stopped manually.")
+        if not _version_rejected.is_set():
+            logger.info("Server stopped manually.")
     except Exception as e:
         logger.error(
-            f"An unexpected error occurred while running the server: {e}", exc_info=True
+            "An unexpected error occurred while running the server: %s",
+            e,
+            exc_info=True,
         )
     finally:
+        with _version_check_lock:
+            _serving = False  # Past app.run: nothing left to interrupt
         logger.info("SpaceBridge MCP Server shut down.")
 
+    if _version_rejected.is_set():
+        logger.error("Server stopped: this client version is no longer supported.")
+        raise SystemExit(1)
+
+
+# Set once the server has confirmed this client version is compatible.
+_version_check_passed = False
+
+# Set by the background version check if this client version is rejected. Under
+# _version_check_lock, main_sync records whether it went on to serve (_serving),
+# so the check knows whether it must interrupt the running server.
+_version_rejected = threading.Event()
+_version_check_lock = threading.Lock()
+_serving = False
+
+
+@lru_cache(maxsize=1)
+def _get_client_version():
+    """Returns this package's parsed version, looked up once per process."""
+    import importlib.metadata
+    from packaging.version import parse as parse_version
 
-def perform_version_check(client: SpaceBridgeClient):
-    """Checks client/server version compatibility."""
     try:
-        # Get own version
-        try:
-            client_version_str = importlib.metadata.version("spacebridge-mcp")
-        except importlib.metadata.PackageNotFoundError:
-            logger.warning(
-                "Could not determine client version using importlib.metadata. Falling back to hardcoded '0.0.0'."
-            )
-            client_version_str = "0.0.0"  # Fallback or read from a constant
+        client_version_str = importlib.metadata.version("spacebridge-mcp")
+    except importlib.metadata.PackageNotFoundError:
+        logger.warning(
+            "Could not determine client version using importlib.metadata. Falling back to hardcoded '0.0.0'."
+        )
+        client_version_str = "0.0.0"  # Fallback or read from a constant
+    return parse_version(client_version_str)
+
 
-        client_version = parse_version(client_version_str)
-        logger.info(f"SpaceBridge-MCP Client Version: {client_version}")
+def perform_version_check(client: SpaceBridgeClient, echo: bool = True):
+    """
+    Checks client/server version compatibility.
+
+    Once the server has confirmed a compatible version, later calls in the
+    same process return True without asking it again. Problems are logged,
+    and also printed to stdout if echo is set; pass echo=False once the stdio
+    transport owns stdout.
+    """
+    global _version_check_passed
+    if _version_check_passed:
+        return True
+    # Imported here as the check only runs once, at startup.
+    from packaging.version import parse as parse_version
+
+    try:
+        # Get own version
+        client_version = _get_client_version()
+        logger.info("SpaceBridge-MCP Client Version: %s", client_version)
 
         # Get server version info
         version_info = client.get_version(client_version=str(client_version))
@@ -675,10 +1213,10 @@ def perform_version_check(client: SpaceBridgeClient):
 
         if not server_version_str:
             logger.warning("Could not retrieve server version from SpaceBridge API.")
-            return  # Continue if server version is unknown
+            return True  # Continue if server version is unknown
 
         server_version = parse_version(server_version_str)
-        logger.info(f"SpaceBridge API Server Version: {server_version}")
+        logger.info("SpaceBridge API Server Version: %s", server_version)
 
         # Check minimum version requirement
         if min_client_str:
@@ -686,7 +1224,8 @@ def perform_version_check(client: SpaceBridgeClient):
             if client_version < min_client_version:
                 error_msg = f"Client version {client_version} is older than the minimum required version {min_client_version} by the server. Please upgrade."
                 logger.error(error_msg)
-                print(f"ERROR: {error_msg}")
+                if echo:
+                    print(f"ERROR: {error_msg}")
                 return False  # Indicate startup should fail
 
         # Check maximum version recommendation
@@ -695,14 +1234,34 @@ def perform_version_check(client: SpaceBridgeClient):
             if client_version < max_client_version:
                 warning_msg = f"Client version {client_version} is older than the latest recommended version {max_client_version}. Consider upgrading for new features/fixes."
                 logger.warning(warning_msg)
-                print(f"WARNING: {warning_msg}")
+                if echo:
+                    print(f"WARNING: {warning_msg}")
 
+        _version_check_passed = True
     except Exception as e:
-        logger.error(f"Failed to perform server version check: {e}", exc_info=True)
+        logger.error("Failed to perform server version check: %s", e, exc_info=True)
         # Decide whether to proceed or fail if version check fails
         # For now, let's proceed with a warning
-        print(
-            "WARNING: Failed to perform server version check against SpaceBridge API."
-        )
+        if echo:
+            print(
+                "WARNING: Failed to perform server version check against SpaceBridge API."
+            )
 
     return True  # Indicate startup can proceed
+
+
+def _run_version_check(client: SpaceBridgeClient):
+    """
+    Runs perform_version_check off the startup path, while the server is already
+    serving stdio, so results go to the log only. If the client is too old, stops
+    the server by interrupting the main thread, which lets main_sync log the
+    reason and shut down cleanly; if the server hasn't started yet, main_sync
+    sees the rejection and doesn't start it.
+    """
+    if perform_version_check(client, echo=False) is not False:
+        return
+    with _version_check_lock:
+        _version_rejected.set()
+        serving = _serving
+    if serving:
+        _thread.interrupt_main()
@@ -3,11 +3,29 @@
 Client for interacting with the SpaceBridge REST API.
 """
 
+import asyncio
 import requests  # Use requests instead of httpx
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 import logging
 import urllib.parse
+from requests.adapters import HTTPAdapter
+
+from .semantic_cache import LRUCache
+
+try:
+    import orjson as _json  # Optional speedup: pip install "spacebridge-mcp[speedups]"
+
+    _dumps = _json.dumps
+except ImportError:
+    import json as _json
+
+    def _dumps(obj) -> bytes:
+        return _json.dumps(obj).encode("utf-8")
+
 
 # Configure logging
 logging.basicConfig(
@@ -15,9 +33,62 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Connections kept open to the API host. Sized for calls fanned out over worker
+# threads; with the requests default of 10, bursts beyond that would close and
+# reopen connections instead of reusing them.
+_POOL_MAXSIZE = 32
+# (connect, read) timeouts in seconds. requests has no default, so an
+# unresponsive API would otherwise hold a worker thread indefinitely.
+DEFAULT_TIMEOUT = (3.0, 10.0)
+# Seconds for which a fetched issue is served from memory (SPACEBRIDGE_ISSUE_CACHE_TTL).
+DEFAULT_ISSUE_CACHE_TTL = 30.0
+# Most issues get_issues fetches at once.
+DEFAULT_MAX_BATCH = 16
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Parses a response body as JSON.
+    Malformed bodies raise requests' JSONDecodeError (a RequestException), as
+    response.json() would, so callers handle them like any other request error.
+    """
+    try:
+        return _json.loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.JSONDecodeError(
+            str(e), response.text, 0, request=response.request, response=response
+        ) from e
+
+
+def _get_issue_cache_ttl() -> float:
+    """Reads SPACEBRIDGE_ISSUE_CACHE_TTL, falling back to the default if invalid."""
+    value = os.getenv("SPACEBRIDGE_ISSUE_CACHE_TTL")
+    if value is None:
+        return DEFAULT_ISSUE_CACHE_TTL
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        logger.warning(
+            "Invalid SPACEBRIDGE_ISSUE_CACHE_TTL value '%s', using default %s.",
+            value,
+            DEFAULT_ISSUE_CACHE_TTL,
+        )
+        return DEFAULT_ISSUE_CACHE_TTL
+
 
 class SpaceBridgeClient:
-    """Handles communication with the SpaceBridge API using requests."""
+    """
+    Handles communication with the SpaceBridge API using requests.
+
+    Each API method has an async variant (aget_issue, asearch_issues, ...) that
+    runs it in a worker thread over the same session, so callers on an event loop
+    can overlap lookups, e.g. `await asyncio.gather(*(client.aget_issue(i) for i in ids))`.
+    """
+
+    # API endpoints, relative to base_url (no leading slash)
+    _ISSUES = "issues"
+    _ISSUES_SEARCH = "issues/search"
+    _VERSION = "version"
 
     def __init__(
         self,
@@ -58,17 +129,36 @@ class SpaceBridgeClient:
         # Ensure base URL ends with /api/v1
         if not self.base_url.endswith("/api/v1"):
             self.base_url += "/api/v1"
+        # Prefix that endpoint paths are appended to
+        self._url_prefix = self.base_url + "/"
 
         # Initialize requests session once
         self._session = requests.Session()
         self._session.headers.update(self.headers)
+        # Keep a larger pool of keep-alive connections, and retry failed
+        # connection attempts (and reads of idempotent requests) twice.
+        adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE, max_retries=2)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Recently fetched issues by (issue, org, project), as (expiry, data).
+        # Cleared by update_issue; disabled when the TTL is 0.
+        self.issue_cache_ttl = _get_issue_cache_ttl()
+        self._issue_cache: LRUCache[tuple] = LRUCache(maxsize=512)
+        self._issue_cache_lock = threading.Lock()
+        # Server version info by client version; it doesn't change while we run.
+        self._version_info: Dict[str, Dict[str, Any]] = {}
 
     def _request(
         self, method: str, endpoint: str, **kwargs
     ) -> Dict[str, Any] | List[Dict[str, Any]]:
-        """Makes a request to the SpaceBridge API using requests."""
+        """
+        Makes a request to the SpaceBridge API using requests.
+        endpoint is relative to base_url and must not start with a slash.
+        """
         # Construct the full URL
-        url = urllib.parse.urljoin(self.base_url + "/", endpoint.lstrip("/"))
+        url = self._url_prefix + endpoint
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
         try:
             response = self._session.request(method, url, **kwargs)
             response.raise_for_status()  # Raise requests.exceptions.HTTPError for bad status codes (4xx or 5xx)
@@ -78,24 +168,19 @@ class SpaceBridgeClient:
             # Check if response content is empty before trying to parse JSON
             if not response.content:
                 return {}  # Or handle as appropriate, maybe log a warning
-            return response.json()
+            return _decode_json(response)
         except requests.exceptions.HTTPError as e:
-            # Log specific HTTP errors
-            error_message = f"HTTP error calling SpaceBridge API ({e.request.url}): {e.response.status_code}"
-            try:
-                # Attempt to get more details from the response body if available
-                error_details = e.response.json()
-                error_message += f" - {error_details}"
-            except requests.exceptions.JSONDecodeError:
-                # Fallback if the error response is not JSON
-                error_message += f" - {e.response.text}"
-            logger.error(error_message)
+            # Log specific HTTP errors, with the response body for details
+            logger.error(
+                "HTTP error calling SpaceBridge API (%s): %s - %s",
+                e.request.url,
+                e.response.status_code,
+                e.response.text,
+            )
             raise  # Re-raise the specific requests error
         except requests.exceptions.RequestException as e:
             # Log other request errors (connection, timeout, etc.)
-            logger.error(
-                f"Request error calling SpaceBridge API ({e.request.url}): {e}"
-            )
+            logger.error("Request error calling SpaceBridge API (%s): %s", url, e)
             raise  # Re-raise the specific requests error
 
     def get_issue(
@@ -106,16 +191,70 @@ class SpaceBridgeClient:
     ) -> Dict[str, Any]:
         """
         Retrieves an issue by its Key, ID or External ID.
+        Served from memory if the same issue was fetched within issue_cache_ttl seconds.
         Corresponds to: GET /api/v1/issues/{issue}
         """
+        if self.issue_cache_ttl <= 0:
+            return self._get_issue_uncached(issue, org_name, project_name)
+
+        key = (issue, org_name, project_name)
+        with self._issue_cache_lock:
+            cached = self._issue_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            logger.debug("Issue %s served from cache.", issue)
+            return dict(cached[1])
+
+        issue_data = self._get_issue_uncached(issue, org_name, project_name)
+        if isinstance(issue_data, dict):
+            with self._issue_cache_lock:
+                self._issue_cache.put(
+                    key, (time.monotonic() + self.issue_cache_ttl, dict(issue_data))
+                )
+        return issue_data
+
+    def get_issues(
+        self,
+        issues: List[str],
+        org_name: Optional[str] = None,
+        project_name: Optional[str] = None,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves several issues, in the order given.
+
+        The API has no batch endpoint, so the issues are fetched concurrently over
+        the session's pooled connections, at most max_batch at a time. Issues
+        repeated in the list are fetched once. Raises the first error encountered.
+        """
+        unique = list(dict.fromkeys(issues))
+        if not unique:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_batch, len(unique)))
+        ) as pool:
+            fetched = pool.map(
+                lambda issue: self.get_issue(
+                    issue, org_name=org_name, project_name=project_name
+                ),
+                unique,
+            )
+            by_issue = dict(zip(unique, fetched))
+        return [by_issue[issue] for issue in issues]
+
+    def _get_issue_uncached(
+        self,
+        issue: str,
+        org_name: Optional[str],
+        project_name: Optional[str],
+    ) -> Dict[str, Any]:
         issue = urllib.parse.quote(issue, safe="")
-        logger.info(f"Fetching issue {issue} from SpaceBridge...")
+        logger.info("Fetching issue %s from SpaceBridge...", issue)
         params = {}
         if project_name:
             params["project"] = project_name
             if org_name:
                 params["organization"] = org_name
-        return self._request("GET", f"issues/{issue}", params=params)
+        return self._request("GET", f"{self._ISSUES}/{issue}", params=params)
 
     def search_issues(
         self,
@@ -158,9 +297,9 @@ class SpaceBridgeClient:
             params["priority"] = priority
         # Add other filters here if implemented
 
-        logger.info(f"Searching issues with params: {params}")
+        logger.info("Searching issues with params: %s", params)
         # Pass filtered params to requests
-        response_data = self._request("GET", "issues/search", params=params)
+        response_data = self._request("GET", self._ISSUES_SEARCH, params=params)
 
         # Assuming API returns a list directly based on previous logic and OpenAPI spec
         if isinstance(response_data, list):
@@ -168,7 +307,8 @@ class SpaceBridgeClient:
         else:
             # Handle unexpected response format
             logger.warning(
-                f"Warning: Unexpected format received from search API: {type(response_data)}. Expected list."
+                "Warning: Unexpected format received from search API: %s. Expected list.",
+                type(response_data),
             )
             return []  # Return empty list if format is wrong
 
@@ -207,9 +347,9 @@ class SpaceBridgeClient:
         if labels:
             payload["labels"] = labels
 
-        # Pass json payload directly to requests
-        logger.info(f"Creating issue with payload: {payload}")
-        return self._request("POST", "issues", json=payload)
+        # Send the payload pre-encoded (the session sets the JSON Content-Type)
+        logger.info("Creating issue with payload: %s", payload)
+        return self._request("POST", self._ISSUES, data=_dumps(payload))
 
     def update_issue(
         self,
@@ -235,7 +375,9 @@ class SpaceBridgeClient:
         update_fields = {k: v for k, v in kwargs.items() if v is not None}
 
         if not update_fields:
-            logger.warning(f"Update issue called for {issue} with no fields to update.")
+            logger.warning(
+                "Update issue called for %s with no fields to update.", issue
+            )
             return {"id": issue, "message": "No fields provided for update."}
 
         payload = update_fields.copy()  # Start payload with actual update fields
@@ -252,12 +394,17 @@ class SpaceBridgeClient:
             if final_org_name:
                 payload["organization"] = final_org_name
 
-        logger.info(f"Updating issue {issue} with payload: {payload}")
+        logger.info("Updating issue %s with payload: %s", issue, payload)
         # Assuming PATCH returns the updated issue data
         # Endpoint already correct here, no change needed for PATCH
         # Changed from PATCH to PUT based on live API 405 error
         issue = urllib.parse.quote(issue, safe="")
-        return self._request("PUT", f"issues/{issue}", json=payload)
+        try:
+            return self._request("PUT", f"{self._ISSUES}/{issue}", data=_dumps(payload))
+        finally:
+            # The issue may be cached under its key, ID or external ID, so drop them all
+            with self._issue_cache_lock:
+                self._issue_cache.clear()
 
     def get_version(self, client_version: str) -> Dict[str, Any]:
         """
@@ -268,35 +415,69 @@ class SpaceBridgeClient:
 
         Corresponds to: GET /api/v1/version
         Includes custom headers: X-Client-Version, X-Client-Organization, X-Client-Project
+        The result is remembered per client_version for the life of the client.
         """
-        custom_headers = self.headers.copy()
-        custom_headers["X-Client-Version"] = client_version
+        version_info = self._version_info.get(client_version)
+        if version_info is not None:
+            return version_info
+
+        # Only the extra headers; the session merges in its own (auth, content type)
+        custom_headers = {"X-Client-Version": client_version}
         if self.org_name:
             custom_headers["X-Client-Organization"] = self.org_name
         if self.project_name:
             custom_headers["X-Client-Project"] = self.project_name
 
-        logger.info(f"Getting server version with client version {client_version}")
-        # Make request with custom headers for this call only using requests
-        # Note: _request now uses the session, which has base headers.
-        # We need to merge headers carefully or make a one-off request.
-        # For simplicity, let's use requests.get directly for this specific case.
-        url = urllib.parse.urljoin(self.base_url + "/", "version")
+        logger.info("Getting server version with client version %s", client_version)
+        # Sent through the session, so this call also opens the pooled
+        # connection that later API calls reuse, instead of a one-off connection.
+        url = self._url_prefix + self._VERSION
         try:
-            response = requests.get(url, headers=custom_headers)
+            response = self._session.get(
+                url, headers=custom_headers, timeout=DEFAULT_TIMEOUT
+            )
             response.raise_for_status()
             if response.status_code == 204 or not response.content:
                 return {}
-            return response.json()
+            version_info = _decode_json(response)
+            self._version_info[client_version] = version_info
+            return version_info
         except requests.exceptions.HTTPError as e:
             logger.error(
-                f"HTTP error getting version ({e.request.url}): {e.response.status_code} - {e.response.text}"
+                "HTTP error getting version (%s): %s - %s",
+                e.request.url,
+                e.response.status_code,
+                e.response.text,
             )
             raise
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request error getting version ({e.request.url}): {e}")
+            logger.error("Request error getting version (%s): %s", url, e)
             raise
 
+    # --- Async variants ---
+
+    async def aget_issue(self, issue: str, **kwargs) -> Dict[str, Any]:
+        """Async variant of get_issue."""
+        return await asyncio.to_thread(self.get_issue, issue, **kwargs)
+
+    async def aget_issues(self, issues: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """Async variant of get_issues."""
+        return await asyncio.to_thread(self.get_issues, issues, **kwargs)
+
+    async def asearch_issues(self, query: str, **kwargs) -> List[Dict[str, Any]]:
+        """Async variant of search_issues."""
+        return await asyncio.to_thread(self.search_issues, query, **kwargs)
+
+    async def acreate_issue(
+        self, title: str, description: str, **kwargs
+    ) -> Dict[str, Any]:
+        """Async variant of create_issue."""
+        return await asyncio.to_thread(self.create_issue, title, description, **kwargs)
+
+    async def aupdate_issue(self, issue: str, **kwargs) -> Dict[str, Any]:
+        """Async variant of update_issue."""
+        return await asyncio.to_thread(self.update_issue, issue, **kwargs)
+
 
 # Example usage (for testing purposes)
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ MCP Tool definitions for SpaceBridge integration.
 # as registration will happen via FastMCP decorators in server.py
 from pydantic import BaseModel, Field
 import logging  # Added for logging LLM calls
-from typing import List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 
 # Keep openai and client imports if needed for models, but likely only needed in server.py now
 # import openai
@@ -77,14 +77,19 @@ class CreateIssueOutput(BaseModel):
         None,
         description="The ID of the created or potentially duplicate existing issue. Can be None if undetermined initially.",
     )
-    status: Literal["created", "existing_duplicate_found", "undetermined"] = Field(
+    status: Literal[
+        "created", "existing_duplicate_found", "undetermined", "pending"
+    ] = Field(
         ...,
-        description="Indicates if a new issue was created, a duplicate was found, or the check was undetermined.",
+        description="Indicates if a new issue was created, a duplicate was found, or the check was undetermined. 'pending' means the request is still running: poll its job_id with poll_create_issue.",
     )
     message: str = Field(..., description="A message describing the outcome.")
     url: Optional[str] = Field(
         None, description="Direct URL to the created/found issue."
     )
+    job_id: Optional[str] = Field(
+        None, description="ID to pass to poll_create_issue while status is 'pending'."
+    )
 
 
 class UpdateIssueInput(BaseModel):
@@ -117,5 +122,38 @@ class UpdateIssueOutput(BaseModel):
     url: Optional[str] = Field(None, description="Direct URL to the updated issue.")
 
 
+class SubCall(BaseModel):
+    tool: Literal["get_issue", "search_issues", "create_issue", "update_issue"] = Field(
+        ..., description="The name of the tool to call."
+    )
+    args: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Arguments for the tool, exactly as for a direct call.",
+    )
+    timeout_ms: Optional[int] = Field(
+        None,
+        description="Optional: Time limit for this call in milliseconds. Ignored for create_issue and update_issue, which always run to completion.",
+    )
+
+
+class SubCallResult(BaseModel):
+    tool: str = Field(..., description="The name of the tool that was called.")
+    status: Literal["ok", "error"] = Field(
+        ..., description="Indicates if the call completed successfully."
+    )
+    result: Optional[Any] = Field(
+        None, description="The tool's output, if the call succeeded."
+    )
+    error: Optional[str] = Field(
+        None, description="A message describing the failure, if the call failed."
+    )
+
+
+class BatchExecuteOutput(BaseModel):
+    results: List[SubCallResult] = Field(
+        ..., description="One result per call, in the same order as the calls."
+    )
+
+
 # ToolProvider class and get_tools function removed.
 # Tool handler functions will be defined and registered in server.py using FastMCP decorators.
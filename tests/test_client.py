@@ -1,7 +1,11 @@
+import asyncio
+import json
 import pytest
 import os  # Import os module
+import requests
 import respx
 from httpx import Response
+from unittest.mock import patch
 
 from spacebridge_mcp.spacebridge_client import SpaceBridgeClient
 from tests.conftest import MOCK_API_URL, MOCK_API_KEY  # Import constants from conftest
@@ -418,3 +422,158 @@ def test_update_issue_no_fields(client: SpaceBridgeClient, client_config):
     # Commenting out respx-specific checks for compatibility with live tests
     # if os.getenv("RUN_LIVE_API_TESTS") != "1":
     #     assert len(respx.calls) == 0 # Ensure no HTTP call was made
+
+
+def _json_response(data, status_code=200):
+    """Builds a requests.Response carrying data as its JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(data).encode("utf-8")
+    return response
+
+
+def test_async_variants_fan_out(client: SpaceBridgeClient):
+    """Async variants run on the shared session and can be gathered."""
+    ids = ["SB-1", "SB-2", "SB-3"]
+
+    def fake_request(method, url, **kwargs):
+        return _json_response({"id": url.rsplit("/", 1)[-1]})
+
+    async def fetch_all():
+        return await asyncio.gather(*(client.aget_issue(i) for i in ids))
+
+    with patch.object(
+        client._session, "request", side_effect=fake_request
+    ) as mock_request:
+        issues = asyncio.run(fetch_all())
+
+    assert [issue["id"] for issue in issues] == ids
+    assert mock_request.call_count == len(ids)
+
+
+def test_requests_use_default_timeout_and_pool(client: SpaceBridgeClient):
+    """API calls get a timeout and share a sized, retrying connection pool."""
+    adapter = client._session.get_adapter(MOCK_API_URL)
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 2
+
+    with patch.object(
+        client._session, "request", return_value=_json_response({"id": "SB-1"})
+    ) as mock_request:
+        client.get_issue("SB-1")
+
+    assert mock_request.call_args.args == ("GET", f"{MOCK_API_URL}/issues/SB-1")
+    assert mock_request.call_args.kwargs["timeout"] == (3.0, 10.0)
+
+
+def test_get_issue_cached_until_update(client: SpaceBridgeClient):
+    """Repeated get_issue calls are served from memory until the issue is updated."""
+    with patch.object(
+        client._session, "request", return_value=_json_response({"id": "SB-1"})
+    ) as mock_request:
+        assert client.get_issue("SB-1") == {"id": "SB-1"}
+        assert client.get_issue("SB-1") == {"id": "SB-1"}
+        assert mock_request.call_count == 1
+
+        client.update_issue("SB-1", status="Closed")
+        client.get_issue("SB-1")
+
+    assert mock_request.call_count == 3
+
+
+def test_get_issue_cache_disabled(monkeypatch):
+    """A TTL of 0 turns the issue cache off."""
+    monkeypatch.setenv("SPACEBRIDGE_ISSUE_CACHE_TTL", "0")
+    client = SpaceBridgeClient()
+    with patch.object(
+        client._session, "request", return_value=_json_response({"id": "SB-1"})
+    ) as mock_request:
+        client.get_issue("SB-1")
+        client.get_issue("SB-1")
+
+    assert mock_request.call_count == 2
+
+
+def test_get_version_remembered(client: SpaceBridgeClient):
+    """Server version info is fetched once per client version."""
+    with patch.object(
+        client._session, "get", return_value=_json_response({"server_version": "1.0"})
+    ) as mock_get:
+        assert client.get_version("0.3.0") == {"server_version": "1.0"}
+        assert client.get_version("0.3.0") == {"server_version": "1.0"}
+
+    mock_get.assert_called_once()
+    assert mock_get.call_args.kwargs["headers"] == {
+        "X-Client-Version": "0.3.0",
+        **({"X-Client-Organization": client.org_name} if client.org_name else {}),
+        **({"X-Client-Project": client.project_name} if client.project_name else {}),
+    }
+
+
+def test_get_issues_fetches_each_issue_once(client: SpaceBridgeClient):
+    """get_issues returns issues in request order, fetching duplicates once."""
+
+    def fake_request(method, url, **kwargs):
+        return _json_response({"id": url.rsplit("/", 1)[-1]})
+
+    with patch.object(
+        client._session, "request", side_effect=fake_request
+    ) as mock_request:
+        issues = client.get_issues(["SB-2", "SB-1", "SB-2"], max_batch=2)
+
+    assert [issue["id"] for issue in issues] == ["SB-2", "SB-1", "SB-2"]
+    assert mock_request.call_count == 2
+
+
+def test_create_issue_sends_encoded_json(client: SpaceBridgeClient):
+    """Request bodies are sent as pre-encoded UTF-8 JSON."""
+    with patch.object(
+        client._session, "request", return_value=_json_response({"id": "SB-9"})
+    ) as mock_request:
+        client.create_issue("Café crash", "Crashes on ü", project_name="proj")
+
+    body = mock_request.call_args.kwargs["data"]
+    assert isinstance(body, bytes)
+    assert json.loads(body)["title"] == "Café crash"
+
+
+def test_http_error_logged_with_body(client: SpaceBridgeClient, caplog):
+    """HTTP errors are logged with status and response body, then re-raised."""
+    response = _json_response({"detail": "Not found"}, status_code=404)
+    response.request = requests.Request("GET", f"{MOCK_API_URL}/issues/SB-0").prepare()
+    with patch.object(client._session, "request", return_value=response):
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get_issue("SB-0")
+
+    assert "404" in caplog.text
+    assert "Not found" in caplog.text
+
+
+def _malformed_response():
+    """Builds a 200 requests.Response whose body is not JSON."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"<html>Bad gateway</html>"
+    return response
+
+
+def test_request_malformed_json_raises_request_error(client: SpaceBridgeClient, caplog):
+    """A non-JSON success body raises requests' JSONDecodeError and is logged."""
+    with patch.object(client._session, "request", return_value=_malformed_response()):
+        with pytest.raises(requests.exceptions.JSONDecodeError) as excinfo:
+            client.get_issue("SB-1")
+
+    assert isinstance(excinfo.value, requests.exceptions.RequestException)
+    assert "Request error calling SpaceBridge API" in caplog.text
+
+
+def test_get_version_malformed_json_raises_request_error(
+    client: SpaceBridgeClient, caplog
+):
+    """get_version reports a non-JSON body as a request error and doesn't cache it."""
+    with patch.object(client._session, "get", return_value=_malformed_response()):
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            client.get_version("0.3.0")
+
+    assert "Request error getting version" in caplog.text
+    assert "0.3.0" not in client._version_info
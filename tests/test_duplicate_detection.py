@@ -0,0 +1,518 @@
+import asyncio
+import gc
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from spacebridge_mcp import duplicate_detection
+from spacebridge_mcp.duplicate_detection import (
+    BatchedOpenAIDuplicateDetector,
+    DuplicateDecision,
+    DuplicateDetectorFactory,
+    HybridDuplicateDetector,
+    OpenAIDuplicateDetector,
+    PairwiseOpenAIDuplicateDetector,
+    ThresholdDuplicateDetector,
+)
+from spacebridge_mcp.semantic_cache import SemanticCache, SemanticCacheStore
+from spacebridge_mcp.tools import IssueSummary
+
+
+@pytest.fixture(autouse=True)
+def clear_detector_caches():
+    """Ensures cached decisions don't leak between tests."""
+    OpenAIDuplicateDetector._decision_cache.clear()
+    OpenAIDuplicateDetector._semantic_cache.clear()
+    OpenAIDuplicateDetector._not_duplicate_keys.clear()
+    duplicate_detection._embedding_cache.clear()
+    yield
+    OpenAIDuplicateDetector._decision_cache.clear()
+    OpenAIDuplicateDetector._semantic_cache.clear()
+    OpenAIDuplicateDetector._not_duplicate_keys.clear()
+    duplicate_detection._embedding_cache.clear()
+
+
+def make_openai_client(llm_content: str, embedding=None) -> AsyncMock:
+    """Builds a mock AsyncOpenAI client returning fixed completion/embedding data."""
+    client = AsyncMock()
+    mock_choice = MagicMock()
+    mock_choice.message.content = llm_content
+    mock_completion = MagicMock()
+    mock_completion.choices = [mock_choice]
+    client.chat.completions.create.return_value = mock_completion
+
+    mock_embedding = MagicMock()
+    mock_embedding.data = [MagicMock(embedding=embedding or [1.0, 0.0, 0.0])]
+    client.embeddings.create.return_value = mock_embedding
+    return client
+
+
+CANDIDATES = [
+    IssueSummary(id="SB-1", title="Login fails", description="500 on login", score=0.8),
+    IssueSummary(id="SB-2", title="Logout slow", description="Takes 10s", score=0.6),
+]
+
+
+@pytest.mark.asyncio
+async def test_openai_detector_exact_cache_hit():
+    """An identical request is answered without a second LLM call."""
+    client = make_openai_client("DUPLICATE: SB-1")
+    detector = OpenAIDuplicateDetector(client=client)
+
+    first = await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+    second = await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+
+    assert first.status == "duplicate"
+    assert second == first
+    client.chat.completions.create.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_openai_detector_lexical_prefilter(monkeypatch):
+    """Candidates sharing too few words are never sent to the LLM."""
+    monkeypatch.setenv("DUPLICATE_LEXICAL_FLOOR", "0.2")
+    monkeypatch.setenv("SEMANTIC_CACHE_THRESHOLD", "0")
+    client = make_openai_client("NOT_DUPLICATE")
+    detector = OpenAIDuplicateDetector(client=client)
+
+    await detector.check_duplicates("Login broken", "Returns error 500", CANDIDATES)
+    prompt = client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+    assert "SB-1" in prompt
+    assert "SB-2" not in prompt
+
+    client.chat.completions.create.reset_mock()
+    decision = await detector.check_duplicates("Dark mode", "Add a theme", CANDIDATES)
+    assert decision.status == "not_duplicate"
+    client.chat.completions.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_openai_detector_semantic_cache_hit(monkeypatch):
+    """A near-identical request with the same candidates reuses the decision."""
+    monkeypatch.setenv("SEMANTIC_CACHE_THRESHOLD", "0.9")
+    client = make_openai_client("NOT_DUPLICATE", embedding=[1.0, 0.0, 0.0])
+    detector = OpenAIDuplicateDetector(client=client)
+
+    first = await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+    client.embeddings.create.return_value.data[0].embedding = [0.99, 0.05, 0.0]
+    second = await detector.check_duplicates("Login is broken", "Error 500", CANDIDATES)
+
+    assert first.status == second.status == "not_duplicate"
+    client.chat.completions.create.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_openai_detector_semantic_cache_scoped_to_candidates():
+    """A semantic match against a different candidate set is not reused."""
+    client = make_openai_client("NOT_DUPLICATE")
+    detector = OpenAIDuplicateDetector(client=client)
+
+    await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+    await detector.check_duplicates("Login broken!", "Error 500", CANDIDATES[:1])
+
+    assert client.chat.completions.create.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_openai_detector_remembers_negatives_after_eviction():
+    """A Bloom filter hit skips the embedding but the LLM still decides."""
+    client = make_openai_client("NOT_DUPLICATE")
+    detector = OpenAIDuplicateDetector(client=client)
+
+    await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+    OpenAIDuplicateDetector._decision_cache.clear()
+    duplicate_detection._embedding_cache.clear()
+    decision = await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+
+    assert decision.status == "not_duplicate"
+    client.embeddings.create.assert_called_once()
+    assert client.chat.completions.create.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_openai_detector_filter_hit_is_not_a_verdict():
+    """A (possibly false-positive) Bloom filter hit never returns not_duplicate alone."""
+    client = make_openai_client("DUPLICATE: SB-1")
+    detector = OpenAIDuplicateDetector(client=client)
+    key = duplicate_detection.make_key("Login broken", "Error 500", "SB-1", "SB-2")
+    OpenAIDuplicateDetector._not_duplicate_keys.add(key)
+
+    decision = await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+
+    assert decision.status == "duplicate"
+    assert decision.duplicate_issue.id == "SB-1"
+
+
+@pytest.mark.asyncio
+async def test_openai_detector_does_not_cache_undetermined():
+    """Undetermined outcomes are retried rather than served from cache."""
+    client = make_openai_client("I am not sure")
+    detector = OpenAIDuplicateDetector(client=client)
+
+    first = await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+    await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+
+    assert first.status == "undetermined"
+    assert client.chat.completions.create.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batched_detector_coalesces_identical_checks(monkeypatch):
+    """Concurrent comparisons in one window are answered by a single LLM call."""
+    monkeypatch.setenv("DUPLICATE_BATCH_WINDOW_MS", "10")
+    monkeypatch.setenv("SEMANTIC_CACHE_THRESHOLD", "0")
+    client = make_openai_client('{"duplicate_ids": ["SB-2", null]}')
+
+    factory = DuplicateDetectorFactory(client=client)
+    detectors = [factory.get_detector(), factory.get_detector()]
+    assert all(
+        isinstance(d.detector, BatchedOpenAIDuplicateDetector) for d in detectors
+    )
+
+    results = await asyncio.gather(
+        detectors[0].check_duplicates("Logout slow", "Takes ages", CANDIDATES),
+        detectors[1].check_duplicates("Logout slow", "Takes ages", CANDIDATES),
+        detectors[0].check_duplicates("Other issue", "Unrelated", CANDIDATES),
+    )
+
+    assert [r.status for r in results] == ["duplicate", "duplicate", "not_duplicate"]
+    assert results[0].duplicate_issue.id == "SB-2"
+    assert client.chat.completions.create.call_count == 1
+    prompt = client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+    assert "=== New Issue 2 ===" in prompt
+    assert "Other issue" in prompt
+
+
+@pytest.mark.asyncio
+async def test_batched_detector_falls_back_to_single_checks(monkeypatch):
+    """An unusable combined reply is retried with one LLM call per comparison."""
+    monkeypatch.setenv("DUPLICATE_BATCH_WINDOW_MS", "10")
+    monkeypatch.setenv("SEMANTIC_CACHE_THRESHOLD", "0")
+    client = make_openai_client("DUPLICATE: SB-2")
+    detector = BatchedOpenAIDuplicateDetector(client=client)
+
+    results = await asyncio.gather(
+        detector.check_duplicates("Logout slow", "Takes ages", CANDIDATES),
+        detector.check_duplicates("Other issue", "Unrelated", CANDIDATES),
+    )
+
+    assert [r.status for r in results] == ["duplicate", "duplicate"]
+    assert client.chat.completions.create.call_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "top_score, expected_status, expect_llm_call",
+    [
+        (0.95, "duplicate", False),  # Above the high threshold: auto-accept
+        (0.2, "not_duplicate", False),  # Below the low threshold: auto-reject
+        (0.6, "not_duplicate", True),  # Uncertain band: ask the LLM
+        (None, "not_duplicate", True),  # No score: ask the LLM
+    ],
+)
+async def test_hybrid_detector_short_circuits(
+    top_score, expected_status, expect_llm_call
+):
+    """Only scores in the uncertain band reach the wrapped LLM detector."""
+    client = make_openai_client("NOT_DUPLICATE")
+    detector = HybridDuplicateDetector(
+        OpenAIDuplicateDetector(client=client), threshold_high=0.9, threshold_low=0.4
+    )
+    candidates = [IssueSummary(id="SB-9", title="Crash on start", score=top_score)]
+
+    decision = await detector.check_duplicates("App crashes", "On launch", candidates)
+
+    assert decision.status == expected_status
+    assert client.chat.completions.create.called is expect_llm_call
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "llm_content, expected_status",
+    [
+        ('{"duplicate_id": "SB-1"}', "duplicate"),
+        ('{"duplicate_id": null}', "not_duplicate"),
+        ('{"duplicate_id": "SB-404"}', "undetermined"),  # ID not among candidates
+        # Plain-text replies from endpoints without structured output
+        ("DUPLICATE: SB-1", "duplicate"),
+        ("  DUPLICATE:SB-1\n", "duplicate"),
+        ("NOT_DUPLICATE", "not_duplicate"),
+        ("NOT_DUPLICATE\n", "not_duplicate"),
+        ("DUPLICATE: SB-404", "undetermined"),  # ID not among candidates
+        ("DUPLICATE:", "undetermined"),
+        ("Maybe a duplicate of SB-1", "undetermined"),
+    ],
+)
+async def test_openai_detector_parses_llm_reply(llm_content, expected_status):
+    """LLM replies are mapped to decisions, rejecting malformed or unknown IDs."""
+    client = make_openai_client(llm_content)
+    detector = OpenAIDuplicateDetector(client=client)
+
+    decision = await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+
+    assert decision.status == expected_status
+    response_format = client.chat.completions.create.call_args.kwargs["response_format"]
+    assert response_format["type"] == "json_schema"
+    if expected_status == "duplicate":
+        assert decision.duplicate_issue.id == "SB-1"
+
+
+@pytest.mark.asyncio
+async def test_openai_detector_model_name(monkeypatch):
+    """The model is read from OPENAI_MODEL once, and can be overridden per instance."""
+    monkeypatch.setenv("OPENAI_MODEL", "env-model")
+    client = make_openai_client("NOT_DUPLICATE")
+
+    assert OpenAIDuplicateDetector(client=client).model_name == "env-model"
+    detector = OpenAIDuplicateDetector(client=client, model_name="ctor-model")
+    await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+
+    assert client.chat.completions.create.call_args.kwargs["model"] == "ctor-model"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "answers, expected_status, expected_id",
+    [
+        (["NO", "YES"], "duplicate", "SB-2"),
+        (["YES", "YES"], "duplicate", "SB-1"),  # Highest-ranked match wins
+        (["NO", "NO"], "not_duplicate", None),
+        (["NO", "Perhaps"], "undetermined", None),
+    ],
+)
+async def test_pairwise_detector(monkeypatch, answers, expected_status, expected_id):
+    """Each candidate is compared concurrently with a small yes/no prompt."""
+    monkeypatch.setenv("DUPLICATE_CHECK_STRATEGY", "pairwise")
+    monkeypatch.setenv("SEMANTIC_CACHE_THRESHOLD", "0")
+    client = make_openai_client("unused")
+    replies = {}
+    for candidate, answer in zip(CANDIDATES, answers):
+        reply = MagicMock()
+        reply.choices = [MagicMock()]
+        reply.choices[0].message.content = answer
+        replies[candidate.title] = reply
+
+    async def fake_create(**kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        return next(r for title, r in replies.items() if title in prompt)
+
+    client.chat.completions.create.side_effect = fake_create
+    detector = DuplicateDetectorFactory(client=client).get_detector().detector
+    assert isinstance(detector, PairwiseOpenAIDuplicateDetector)
+    assert detector.model_name == "gpt-4o-mini"
+
+    decision = await detector.check_duplicates("Auth issues", "Broken", CANDIDATES)
+
+    assert decision.status == expected_status
+    assert client.chat.completions.create.call_count == len(CANDIDATES)
+    if expected_id:
+        assert decision.duplicate_issue.id == expected_id
+
+
+def test_factory_reuses_detector(monkeypatch):
+    """The factory builds its detector once and returns it on later calls."""
+    factory = DuplicateDetectorFactory(client=make_openai_client("NOT_DUPLICATE"))
+    first = factory.get_detector()
+
+    monkeypatch.delenv("OPENAI_API_KEY")
+    assert factory.get_detector() is first
+    assert isinstance(first, HybridDuplicateDetector)
+
+
+def test_factory_passes_client_to_threshold_detector(monkeypatch):
+    """Without OPENAI_API_KEY the threshold detector still gets the client."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    client = make_openai_client("unused")
+
+    detector = DuplicateDetectorFactory(client=client).get_detector()
+
+    assert isinstance(detector, ThresholdDuplicateDetector)
+    assert detector.client is client
+
+
+@pytest.mark.asyncio
+async def test_threshold_detector_uses_best_score(monkeypatch):
+    """The best-scoring candidate is used even when results arrive unsorted."""
+    monkeypatch.setenv("DUPLICATE_SIMILARITY_THRESHOLD", "0.75")
+    candidates = [
+        IssueSummary(id="SB-3", title="Unscored"),
+        *reversed(CANDIDATES),
+    ]
+
+    decision = await ThresholdDuplicateDetector().check_duplicates(
+        "Login broken", "Error 500", candidates
+    )
+
+    assert decision.status == "duplicate"
+    assert decision.duplicate_issue.id == "SB-1"
+
+
+@pytest.mark.asyncio
+async def test_threshold_detector_scores_unscored_candidates_locally(monkeypatch):
+    """With a client, unscored candidates are scored from one embeddings call."""
+    monkeypatch.setenv("DUPLICATE_SIMILARITY_THRESHOLD", "0.75")
+    client = make_openai_client("unused")
+    client.embeddings.create.return_value.data = [
+        MagicMock(embedding=[1.0, 0.0]),  # New issue
+        MagicMock(embedding=[0.0, 1.0]),  # SB-3: orthogonal
+        MagicMock(embedding=[0.9, 0.1]),  # SB-4: near-identical
+    ]
+    candidates = [
+        IssueSummary(id="SB-3", title="Dark mode"),
+        IssueSummary(id="SB-4", title="Login fails"),
+    ]
+
+    decision = await ThresholdDuplicateDetector(client=client).check_duplicates(
+        "Login broken", "Error 500", candidates
+    )
+
+    assert decision.status == "duplicate"
+    assert decision.duplicate_issue.id == "SB-4"
+    assert decision.duplicate_issue.score == pytest.approx(0.9939, abs=1e-3)
+    client.embeddings.create.assert_called_once()
+    assert len(client.embeddings.create.call_args.kwargs["input"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_openai_detector_shortens_candidate_descriptions():
+    """Long descriptions are truncated and low-score ones are left out."""
+    client = make_openai_client("NOT_DUPLICATE")
+    candidates = [
+        IssueSummary(id="SB-1", title="Login fails", description="x" * 1000, score=0.8),
+        IssueSummary(
+            id="SB-2", title="Logout slow", description="Takes 10s", score=0.3
+        ),
+    ]
+
+    await OpenAIDuplicateDetector(client=client).check_duplicates(
+        "Login broken", "Error 500", candidates
+    )
+
+    prompt = client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+    assert "x" * 400 + "…" in prompt
+    assert "x" * 401 not in prompt
+    assert "Takes 10s" not in prompt
+
+
+@pytest.mark.asyncio
+async def test_openai_detector_shortens_new_description():
+    """The new issue's description is cut to its own, larger budget."""
+    client = make_openai_client("NOT_DUPLICATE")
+
+    await OpenAIDuplicateDetector(client=client).check_duplicates(
+        "Login broken", "y" * 5000, CANDIDATES
+    )
+
+    prompt = client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+    assert "y" * 1000 + "…" in prompt
+    assert "y" * 1001 not in prompt
+
+
+def test_make_shared_client_bounds_latency(monkeypatch):
+    """The shared client times out quickly and retries once."""
+    monkeypatch.delenv("OPENAI_TIMEOUT", raising=False)
+    client = duplicate_detection.make_shared_client("test-key")
+    assert client.timeout.read == 8.0
+    assert client.timeout.connect == 2.0
+    assert client.max_retries == 1
+
+    monkeypatch.setenv("OPENAI_TIMEOUT", "1.5")
+    client = duplicate_detection.make_shared_client("test-key")
+    assert client.timeout.read == 1.5
+    assert client.timeout.connect == 1.5
+
+
+def test_openai_detector_default_model(monkeypatch):
+    """Without OPENAI_MODEL the single-call check uses the small model."""
+    monkeypatch.delenv("OPENAI_MODEL", raising=False)
+    detector = OpenAIDuplicateDetector(client=make_openai_client("unused"))
+    assert detector.model_name == "gpt-4o-mini"
+
+
+@pytest.mark.asyncio
+async def test_embed_text_batches_concurrent_requests():
+    """Concurrent embeddings share one request; repeats are served from memory."""
+    client = make_openai_client("unused")
+    client.embeddings.create.return_value.data = [
+        MagicMock(embedding=[1.0, 0.0]),
+        MagicMock(embedding=[0.0, 1.0]),
+    ]
+
+    first, second = await asyncio.gather(
+        duplicate_detection.embed_text(client, "first"),
+        duplicate_detection.embed_text(client, "second"),
+    )
+    again = await duplicate_detection.embed_text(client, "first")
+
+    assert (first, second, again) == ([1.0, 0.0], [0.0, 1.0], [1.0, 0.0])
+    client.embeddings.create.assert_called_once()
+    assert client.embeddings.create.call_args.kwargs["input"] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_embed_text_short_response_fails_missing_inputs():
+    """Inputs the response has no embedding for fail instead of waiting forever."""
+    client = make_openai_client("unused")
+    client.embeddings.create.return_value.data = [
+        MagicMock(index=1, embedding=[0.0, 1.0]),
+    ]
+
+    first, second = await asyncio.wait_for(
+        asyncio.gather(
+            duplicate_detection.embed_text(client, "first"),
+            duplicate_detection.embed_text(client, "second"),
+        ),
+        timeout=1,
+    )
+
+    assert first is None  # embed_text reports the failure as a cache miss
+    assert second == [0.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_embedding_batcher_keeps_batches_in_flight_alive():
+    """A batch being sent is strongly referenced until it resolves its futures."""
+    release = asyncio.Event()
+    client = make_openai_client("unused")
+
+    async def slow_create(**kwargs):
+        await release.wait()
+        return MagicMock(data=[MagicMock(index=0, embedding=[1.0, 0.0])])
+
+    client.embeddings.create.side_effect = slow_create
+    batcher = duplicate_detection.EmbeddingBatcher(client, "model", window_seconds=0)
+
+    pending = asyncio.ensure_future(batcher.embed("first"))
+    await asyncio.sleep(0.01)
+    assert len(batcher._tasks) == 1
+    gc.collect()
+    release.set()
+
+    assert await asyncio.wait_for(pending, timeout=1) == [1.0, 0.0]
+    assert not batcher._tasks
+
+
+@pytest.mark.asyncio
+async def test_openai_detector_semantic_cache_persists(tmp_path, monkeypatch):
+    """Decisions saved to a store are reused by a restarted server."""
+    path = str(tmp_path / "cache.sqlite")
+    monkeypatch.setattr(OpenAIDuplicateDetector, "_semantic_cache", SemanticCache())
+    store = SemanticCacheStore(path)
+    assert OpenAIDuplicateDetector.attach_store(store) == 0
+    client = make_openai_client('{"duplicate_id": "SB-1"}')
+    detector = OpenAIDuplicateDetector(client=client)
+    await detector.check_duplicates("Login broken", "Error 500", CANDIDATES)
+    store.close()  # Shutdown writes the queued decision
+
+    # Simulate a restart: fresh in-memory caches, restored from the same file
+    OpenAIDuplicateDetector._decision_cache.clear()
+    monkeypatch.setattr(OpenAIDuplicateDetector, "_semantic_cache", SemanticCache())
+    assert OpenAIDuplicateDetector.attach_store(SemanticCacheStore(path)) == 1
+    restarted_client = make_openai_client('{"duplicate_id": null}')
+    decision = await OpenAIDuplicateDetector(client=restarted_client).check_duplicates(
+        "Login broken!", "Error 500", CANDIDATES
+    )
+
+    assert decision == DuplicateDecision(
+        status="duplicate", duplicate_issue=CANDIDATES[0]
+    )
+    restarted_client.chat.completions.create.assert_not_called()
@@ -0,0 +1,141 @@
+import random
+import sqlite3
+
+import pytest
+
+from spacebridge_mcp.semantic_cache import (
+    BloomFilter,
+    SemanticCache,
+    SemanticCacheStore,
+    dot,
+    make_key,
+    normalize,
+    quantize,
+)
+
+
+def test_quantize_preserves_cosine_similarity():
+    """int8 dot products stay close to the float32 result."""
+    rng = random.Random(0)
+    a = normalize([rng.gauss(0, 1) for _ in range(1536)])
+    b = normalize([x + rng.gauss(0, 0.3) for x in a])
+
+    (qa, scale_a), (qb, scale_b) = quantize(a), quantize(b)
+
+    assert qa.typecode == "b"
+    assert dot(qa, qb) * scale_a * scale_b == pytest.approx(dot(a, b), abs=0.01)
+
+
+def test_quantize_zero_vector():
+    vector, scale = quantize([0.0, 0.0, 0.0])
+    assert list(vector) == [0, 0, 0]
+    assert scale == 0.0
+
+
+def test_semantic_cache_lookup_by_namespace_and_threshold():
+    cache = SemanticCache(maxsize=2)
+    cache.add([1.0, 0.0], "first", namespace="a")
+
+    assert cache.lookup([0.99, 0.05], namespace="a", threshold=0.95) == "first"
+    assert cache.lookup([0.99, 0.05], namespace="b", threshold=0.95) is None
+    assert cache.lookup([0.0, 1.0], namespace="a", threshold=0.95) is None
+
+
+def test_semantic_cache_eviction_keeps_namespace_index():
+    """Evicted entries stop matching and empty namespaces are dropped."""
+    cache: SemanticCache[str] = SemanticCache(maxsize=2)
+    cache.add([1.0, 0.0], "a", ("org", "a"))
+    cache.add([1.0, 0.0], "b", ("org", "b"))
+    cache.add([1.0, 0.0], "b2", ("org", "b"))
+
+    assert cache.lookup([1.0, 0.0], ("org", "a"), 0.9) is None
+    assert cache.lookup([1.0, 0.0], ("org", "b"), 0.9) == "b2"
+    assert list(cache._namespaces) == [("org", "b")]
+
+
+def test_bloom_filter_membership_and_reset():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [make_key("issue", str(i)) for i in range(1000)]
+    for key in added:
+        bloom.add(key)
+
+    assert all(key in bloom for key in added)
+    false_positives = sum(make_key("other", str(i)) in bloom for i in range(1000))
+    assert false_positives < 50
+
+    bloom.add(make_key("overflow"))  # Exceeds capacity: starts afresh
+    assert len(bloom) == 1
+    assert added[0] not in bloom
+
+
+def test_semantic_cache_store_survives_restart(tmp_path):
+    """Entries written through a store are restored, newest ones first to go."""
+    path = str(tmp_path / "cache.sqlite")
+    store = SemanticCacheStore(path)
+    cache: SemanticCache[str] = SemanticCache(maxsize=2)
+    assert cache.attach(store, "issues", str, str) == 0
+    cache.add([1.0, 0.0], "SB-1", ("org", "proj"))
+    cache.add([0.0, 1.0], "SB-2", ("org", "proj"))
+    cache.add([0.7, 0.7], "SB-3", ("org", None))
+    store.close()
+
+    restored: SemanticCache[str] = SemanticCache(maxsize=2)
+    assert restored.attach(SemanticCacheStore(path), "issues", str, str) == 2
+    assert restored.lookup([1.0, 0.0], ("org", "proj"), 0.95) is None  # Trimmed
+    assert restored.lookup([0.0, 1.0], ("org", "proj"), 0.95) == "SB-2"
+    assert restored.lookup([0.7, 0.7], ("org", None), 0.95) == "SB-3"
+    # Other caches sharing the file are kept apart
+    other: SemanticCache[str] = SemanticCache()
+    assert other.attach(SemanticCacheStore(path), "decisions", str, str) == 0
+
+
+def test_semantic_cache_store_writes_in_background(tmp_path):
+    """Appends return at once; flush waits until they are committed."""
+    path = str(tmp_path / "cache.sqlite")
+    store = SemanticCacheStore(path)
+    cache: SemanticCache[str] = SemanticCache()
+    cache.attach(store, "issues", str, str)
+    for i in range(20):
+        cache.add([1.0, float(i)], f"SB-{i}", ("org",))
+    store.flush()
+
+    conn = sqlite3.connect(path)
+    (count,) = conn.execute("SELECT COUNT(*) FROM semantic_cache").fetchone()
+    conn.close()
+    store.close()
+    assert count == 20
+
+
+def test_semantic_cache_max_age(monkeypatch):
+    """Entries older than max_age are ignored, including restored ones."""
+    cache: SemanticCache[str] = SemanticCache()
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    cache.add([1.0, 0.0], "old", namespace="a")
+    monkeypatch.setattr("time.time", lambda: 1500.0)
+
+    assert cache.lookup([1.0, 0.0], "a", 0.95) == "old"
+    assert cache.lookup([1.0, 0.0], "a", 0.95, max_age=600) == "old"
+    assert cache.lookup([1.0, 0.0], "a", 0.95, max_age=300) is None
+
+
+def test_semantic_cache_store_upgrades_old_file(tmp_path):
+    """Files written before entries were timestamped load as expired entries."""
+    path = str(tmp_path / "cache.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE semantic_cache (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "cache TEXT NOT NULL, namespace TEXT NOT NULL, vector BLOB NOT NULL, "
+        "scale REAL NOT NULL, value TEXT NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO semantic_cache (cache, namespace, vector, scale, value) "
+        "VALUES ('issues', '[\"org\"]', ?, 1.0, 'SB-1')",
+        (bytes([127, 0]),),
+    )
+    conn.commit()
+    conn.close()
+
+    cache: SemanticCache[str] = SemanticCache()
+    assert cache.attach(SemanticCacheStore(path), "issues", str, str) == 1
+    assert cache.lookup([1.0, 0.0], ("org",), 0.9) == "SB-1"
+    assert cache.lookup([1.0, 0.0], ("org",), 0.9, max_age=3600) is None
@@ -1,11 +1,15 @@
 import pytest  # Corrected typo
+import asyncio
 import os  # Add os import
-import configparser  # Add configparser import
+import threading
+import time
 from pathlib import Path  # Add Path import
 from unittest.mock import AsyncMock, patch, MagicMock  # Import MagicMock
 import importlib.metadata  # Add import for version check test
 import argparse  # Add import for config test
 
+from spacebridge_mcp import server
+
 # Import the FastMCP app instance and handlers from server.py
 # Note: This assumes server.py can be imported without starting the server immediately.
 # We might need to adjust server.py slightly if clients are initialized at module level.
@@ -14,18 +18,26 @@ from spacebridge_mcp.server import (
     get_issue_tool_handler,
     search_issues_handler,
     create_issue_handler,
+    poll_create_issue_handler,
     update_issue_handler,  # Added update handler
+    batch_execute_handler,
     get_git_info,
     perform_version_check,
+    _get_client_version,
+    _run_version_check,
     main_sync,  # Import main_sync for testing config loading
 )
 from spacebridge_mcp.spacebridge_client import (
     SpaceBridgeClient,
 )  # Import class for type hints
+from spacebridge_mcp.semantic_cache import SemanticCache
+from spacebridge_mcp.duplicate_detection import DuplicateDecision
 from spacebridge_mcp.tools import (
     SearchIssuesOutput,
     CreateIssueOutput,
     UpdateIssueOutput,  # Added update schemas
+    SubCall,
+    BatchExecuteOutput,
 )
 
 # Resource import removed as handler returns dict
@@ -58,6 +70,51 @@ async def test_get_issue_tool_handler_success():
     assert result_data == expected_data
 
 
+@pytest.mark.asyncio
+async def test_get_issue_tool_handler_does_not_block_event_loop():
+    """Test that concurrent requests run the sync client calls in parallel."""
+    both_in_flight = threading.Barrier(2, timeout=5)
+
+    def slow_get_issue(issue, **kwargs):
+        both_in_flight.wait()  # Fails if the calls are serialized on the event loop
+        return {"id": issue}
+
+    mock_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_client_instance.get_issue.side_effect = slow_get_issue
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_client_instance):
+        results = await asyncio.gather(
+            get_issue_tool_handler(issue="SB-1"),
+            get_issue_tool_handler(issue="SB-2"),
+        )
+
+    assert results == [{"id": "SB-1"}, {"id": "SB-2"}]
+
+
+@pytest.mark.asyncio
+async def test_get_issue_tool_handler_shares_concurrent_lookups():
+    """Concurrent requests for the same issue share one client call."""
+    release = threading.Event()
+
+    def slow_get_issue(issue, **kwargs):
+        release.wait(timeout=5)
+        return {"id": issue}
+
+    mock_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_client_instance.get_issue.side_effect = slow_get_issue
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_client_instance):
+        requests = [
+            asyncio.ensure_future(get_issue_tool_handler(issue="SB-1"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*requests)
+
+    assert results == [{"id": "SB-1"}] * 3
+    mock_client_instance.get_issue.assert_called_once()
+    assert not server._inflight_issue_fetches
+
+
 # Removed respx mock, will mock client method to raise error
 @pytest.mark.asyncio
 async def test_get_issue_tool_handler_not_found():
@@ -163,6 +220,25 @@ async def test_search_issues_handler_context_priority(
     assert result.results[0].title == "Search Result"
 
 
+@pytest.mark.asyncio
+async def test_search_issues_handler_validates_results():
+    """Raw search results are validated into IssueSummary models in one pass."""
+    mock_sb_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_sb_client_instance.org_name = None
+    mock_sb_client_instance.project_name = None
+    mock_sb_client_instance.search_issues.return_value = [
+        {"id": "SB-1", "title": "Login fails", "score": "0.9", "extra": "ignored"},
+        {"id": "SB-2", "title": "Logout slow"},
+    ]
+
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_sb_client_instance):
+        result = await search_issues_handler(query="login")
+
+    assert [issue.id for issue in result.results] == ["SB-1", "SB-2"]
+    assert result.results[0].score == 0.9
+    assert result.results[1].score is None
+
+
 @pytest.mark.asyncio
 @patch(
     "spacebridge_mcp.server.openai_client", new_callable=AsyncMock
@@ -248,7 +324,7 @@ async def test_create_issue_handler_duplicate_found(mock_openai_client_instance)
             "id": existing_issue_id,
             "title": "Existing Issue",
             "description": "Very similar",
-            "score": 0.98,
+            "score": 0.85,  # Within the hybrid detector's uncertain band, so the LLM decides
             "url": existing_issue_url,
         }
     ]
@@ -378,6 +454,276 @@ async def test_create_issue_handler_not_duplicate(mock_openai_client_instance):
     mock_openai_client_instance.chat.completions.create.assert_called_once()
 
 
+@pytest.mark.asyncio
+@patch("spacebridge_mcp.server.openai_client", new_callable=AsyncMock)
+@patch("spacebridge_mcp.server._recent_create_requests", SemanticCache())
+async def test_create_issue_handler_reuses_recent_request(
+    mock_openai_client_instance, monkeypatch
+):
+    """A near-identical create request resolves to the issue created before."""
+    monkeypatch.setenv("SPACEBRIDGE_SEMCACHE_THRESHOLD", "0.92")
+    mock_openai_client_instance.embeddings.create.side_effect = [
+        MagicMock(data=[MagicMock(embedding=[1.0, 0.0, 0.0])]),
+        MagicMock(data=[MagicMock(embedding=[0.99, 0.05, 0.0])]),
+    ]
+    mock_sb_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_sb_client_instance.org_name = "startup_org"
+    mock_sb_client_instance.project_name = "startup_proj"
+    mock_sb_client_instance.search_issues.return_value = []
+    mock_sb_client_instance.create_issue.return_value = {
+        "id": "SB-100",
+        "url": f"{MOCK_API_URL}/issues/SB-100",
+    }
+
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_sb_client_instance):
+        first = await create_issue_handler(title="Crash on save", description="NPE")
+        second = await create_issue_handler(title="Crash on save!", description="NPE")
+
+    assert first.status == "created"
+    assert second.status == "existing_duplicate_found"
+    assert second.issue_id == "SB-100"
+    assert second.url == f"{MOCK_API_URL}/issues/SB-100"
+    # The search overlaps the cache lookup, but only the first result is used
+    mock_sb_client_instance.create_issue.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("spacebridge_mcp.server.openai_client", new_callable=AsyncMock)
+async def test_create_issue_handler_cancels_search_when_cancelled(
+    mock_openai_client_instance, monkeypatch
+):
+    """Cancelling the request during the cache lookup also cancels the search."""
+    monkeypatch.setenv("SPACEBRIDGE_SEMCACHE_THRESHOLD", "0.92")
+    mock_sb_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_sb_client_instance.org_name = "startup_org"
+    mock_sb_client_instance.project_name = "startup_proj"
+    mock_sb_client_instance.search_issues.return_value = []
+    started = []
+    search_duplicates = server._search_duplicates
+
+    def track(*args):
+        search = search_duplicates(*args)
+        started.append(search)
+        return search
+
+    with (
+        patch("spacebridge_mcp.server.spacebridge_client", mock_sb_client_instance),
+        patch(
+            "spacebridge_mcp.server.embed_text",
+            AsyncMock(side_effect=asyncio.CancelledError),
+        ),
+        patch("spacebridge_mcp.server._search_duplicates", side_effect=track),
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            await create_issue_handler(title="Crash on save", description="NPE")
+
+    assert len(started) == 1
+    assert started[0].cancelled()
+    mock_sb_client_instance.create_issue.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("spacebridge_mcp.server.openai_client", new_callable=AsyncMock)
+@patch("spacebridge_mcp.server._recent_create_requests", SemanticCache())
+async def test_create_issue_handler_recent_request_cache_off_by_default(
+    mock_openai_client_instance, monkeypatch
+):
+    """Without SPACEBRIDGE_SEMCACHE_THRESHOLD, every request gets a full duplicate check."""
+    monkeypatch.delenv("SPACEBRIDGE_SEMCACHE_THRESHOLD", raising=False)
+    mock_sb_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_sb_client_instance.org_name = "startup_org"
+    mock_sb_client_instance.project_name = "startup_proj"
+    mock_sb_client_instance.search_issues.return_value = []
+    mock_sb_client_instance.create_issue.return_value = {"id": "SB-100"}
+
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_sb_client_instance):
+        await create_issue_handler(title="Crash on save", description="NPE")
+        second = await create_issue_handler(title="Crash on save", description="NPE")
+
+    assert second.status == "created"
+    assert mock_sb_client_instance.search_issues.call_count == 2
+    mock_openai_client_instance.embeddings.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("spacebridge_mcp.server.openai_client", None)
+async def test_create_issue_handler_coalesces_concurrent_searches():
+    """Identical requests arriving together share one similarity search."""
+    mock_sb_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_sb_client_instance.org_name = "startup_org"
+    mock_sb_client_instance.project_name = "startup_proj"
+    mock_sb_client_instance.search_issues.return_value = []
+    mock_sb_client_instance.create_issue.return_value = {"id": "SB-100"}
+
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_sb_client_instance):
+        results = await asyncio.gather(
+            create_issue_handler(title="Crash on save", description="NPE"),
+            create_issue_handler(title="Crash on save", description="NPE"),
+            create_issue_handler(title="Crash on load", description="NPE"),
+        )
+        # Finished searches are not reused
+        await create_issue_handler(title="Crash on save", description="NPE")
+
+    assert [result.status for result in results] == ["created"] * 3
+    assert mock_sb_client_instance.search_issues.call_count == 3
+    assert not server._inflight_searches
+
+
+@pytest.mark.asyncio
+@patch("spacebridge_mcp.server.openai_client", None)
+async def test_create_issue_handler_validates_only_checked_candidates():
+    """Search results the detector ignores are never turned into IssueSummary."""
+    mock_sb_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_sb_client_instance.org_name = "startup_org"
+    mock_sb_client_instance.project_name = "startup_proj"
+    mock_sb_client_instance.search_issues.return_value = [
+        {"id": f"SB-{i}", "title": f"Issue {i}", "score": 0.5} for i in range(10)
+    ]
+    mock_sb_client_instance.create_issue.return_value = {"id": "SB-100"}
+    mock_detector = MagicMock(max_candidates=3)
+    mock_detector.check_duplicates = AsyncMock(
+        return_value=DuplicateDecision(status="not_duplicate")
+    )
+
+    with (
+        patch("spacebridge_mcp.server.spacebridge_client", mock_sb_client_instance),
+        patch("spacebridge_mcp.server._detector_factory", None),
+        patch("spacebridge_mcp.server.DuplicateDetectorFactory") as mock_factory,
+    ):
+        mock_factory.return_value.get_detector.return_value = mock_detector
+        result = await create_issue_handler(title="Crash on save", description="NPE")
+
+    assert result.status == "created"
+    checked = mock_detector.check_duplicates.call_args.kwargs["potential_duplicates"]
+    assert [dup.id for dup in checked] == ["SB-0", "SB-1", "SB-2"]
+
+
+@pytest.mark.asyncio
+@patch("spacebridge_mcp.server.openai_client", None)
+async def test_create_issue_handler_skips_search_for_short_text():
+    """Very short issues are created without a similarity search."""
+    mock_sb_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_sb_client_instance.org_name = "startup_org"
+    mock_sb_client_instance.project_name = "startup_proj"
+    mock_sb_client_instance.create_issue.return_value = {"id": "SB-NEW"}
+
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_sb_client_instance):
+        result = await create_issue_handler(title="Fix typo", description="  ")
+
+    assert result.status == "created"
+    mock_sb_client_instance.search_issues.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("spacebridge_mcp.server.openai_client", None)
+async def test_create_issue_handler_async_job(monkeypatch):
+    """With SPACEBRIDGE_ASYNC_CREATE, create_issue returns a job to poll."""
+    monkeypatch.setenv("SPACEBRIDGE_ASYNC_CREATE", "1")
+    search_may_finish = threading.Event()
+
+    def search_issues(**kwargs):
+        search_may_finish.wait(timeout=5)
+        return []
+
+    mock_sb_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_sb_client_instance.org_name = "startup_org"
+    mock_sb_client_instance.project_name = "startup_proj"
+    mock_sb_client_instance.search_issues.side_effect = search_issues
+    mock_sb_client_instance.create_issue.return_value = {
+        "id": "SB-NEW",
+        "url": "http://new",
+    }
+
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_sb_client_instance):
+        started = await create_issue_handler(title="Crash on save", description="NPE")
+        assert started.status == "pending"
+        assert started.job_id
+
+        still_running = await poll_create_issue_handler(job_id=started.job_id)
+        assert still_running.status == "pending"
+
+        search_may_finish.set()
+        await asyncio.wait_for(server._create_jobs.get(started.job_id), timeout=5)
+        result = await poll_create_issue_handler(job_id=started.job_id)
+
+    assert result.status == "created"
+    assert result.issue_id == "SB-NEW"
+    with pytest.raises(ValueError, match="Unknown or already collected"):
+        await poll_create_issue_handler(job_id=started.job_id)
+
+
+@pytest.mark.asyncio
+@patch("spacebridge_mcp.server.openai_client", None)
+async def test_create_issue_jobs_expire_only_after_finishing(monkeypatch):
+    """Running jobs are always kept; finished ones are dropped after the TTL."""
+    monkeypatch.setenv("SPACEBRIDGE_ASYNC_CREATE", "1")
+    monkeypatch.setattr(server, "CREATE_JOB_RESULT_TTL", 0)
+    monkeypatch.setattr(server, "_create_jobs", {})
+    monkeypatch.setattr(server, "_finished_create_jobs", {})
+    slow_may_finish = threading.Event()
+
+    def search_issues(query, **kwargs):
+        if query.startswith("Slow"):
+            slow_may_finish.wait(timeout=5)
+        return []
+
+    mock_sb_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_sb_client_instance.org_name = "startup_org"
+    mock_sb_client_instance.project_name = "startup_proj"
+    mock_sb_client_instance.search_issues.side_effect = search_issues
+    mock_sb_client_instance.create_issue.return_value = {"id": "SB-NEW"}
+
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_sb_client_instance):
+        slow = await create_issue_handler(title="Slow crash on save", description="NPE")
+        fast = await create_issue_handler(title="Fast crash on save", description="NPE")
+        await asyncio.wait_for(server._create_jobs[fast.job_id], timeout=5)
+        await asyncio.sleep(0.01)
+        await create_issue_handler(title="Another crash on load", description="NPE")
+
+        assert slow.job_id in server._create_jobs  # Still running: never dropped
+        assert fast.job_id not in server._create_jobs  # Finished and expired
+
+        slow_may_finish.set()
+        await asyncio.wait_for(server._create_jobs[slow.job_id], timeout=5)
+        assert (await poll_create_issue_handler(job_id=slow.job_id)).status == "created"
+        await asyncio.gather(*server._create_jobs.values())
+
+
+@pytest.mark.asyncio
+@patch("spacebridge_mcp.server._detector_factory", None)
+async def test_create_issue_handler_reuses_detector(monkeypatch):
+    """The detector is built once and shared until the OpenAI client changes."""
+    monkeypatch.setenv("SPACEBRIDGE_SEMCACHE_THRESHOLD", "0")  # No embedding lookups
+    mock_sb_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_sb_client_instance.org_name = "startup_org"
+    mock_sb_client_instance.project_name = "startup_proj"
+    mock_sb_client_instance.search_issues.return_value = [
+        {"id": "SB-1", "title": "Issue 1", "score": 0.5}
+    ]
+    mock_sb_client_instance.create_issue.return_value = {"id": "SB-100"}
+    mock_detector = MagicMock(max_candidates=None)
+    mock_detector.check_duplicates = AsyncMock(
+        return_value=DuplicateDecision(status="not_duplicate")
+    )
+
+    with (
+        patch("spacebridge_mcp.server.spacebridge_client", mock_sb_client_instance),
+        patch("spacebridge_mcp.server.openai_client", None),
+        patch("spacebridge_mcp.server.DuplicateDetectorFactory") as mock_factory,
+    ):
+        mock_factory.return_value.openai_client = None
+        mock_factory.return_value.get_detector.return_value = mock_detector
+        await create_issue_handler(title="Crash on save", description="NPE")
+        await create_issue_handler(title="Crash on load", description="NPE")
+        mock_factory.assert_called_once_with(client=None)
+
+        with patch("spacebridge_mcp.server.openai_client", AsyncMock()):
+            await create_issue_handler(title="Crash on exit", description="NPE")
+        assert mock_factory.call_count == 2
+
+    assert mock_detector.check_duplicates.await_count == 3
+
+
 # --- Test Git Info Extraction ---
 
 
@@ -421,6 +767,42 @@ fetch = +refs/heads/*:refs/remotes/origin/*
     assert project == "another-repo"
 
 
+def test_get_git_info_trailing_slash(tmp_path: Path):
+    """Test extracting info from a remote URL with a trailing slash."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    config_path = git_dir / "config"
+    config_content = """
+[remote "origin"]
+url = https://github.com/slash-org/slash-repo.git/
+"""
+    config_path.write_text(config_content)
+    org, project = get_git_info(str(config_path))
+    assert org == "slash-org"
+    assert project == "slash-repo"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "ssh://git@github.com/scheme-org/scheme-repo.git",
+        "ssh://git@github.com:2222/scheme-org/scheme-repo.git",
+        "git://github.com/scheme-org/scheme-repo.git",
+        "git+ssh://git@github.com/scheme-org/scheme-repo",
+        "http://gitlab.local/scheme-org/scheme-repo/",
+    ],
+)
+def test_get_git_info_url_schemes(tmp_path: Path, url: str):
+    """Test extracting info from the other URL schemes git accepts."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    config_path = git_dir / "config"
+    config_path.write_text(f'[remote "origin"]\nurl = {url}\n')
+    org, project = get_git_info(str(config_path))
+    assert org == "scheme-org"
+    assert project == "scheme-repo"
+
+
 def test_get_git_info_https_no_suffix(tmp_path: Path):
     """Test extracting info from HTTPS remote URL without .git suffix."""
     git_dir = tmp_path / ".git"
@@ -459,6 +841,23 @@ repositoryformatversion = 0
     assert project is None
 
 
+def test_get_git_info_falls_back_to_other_remote(tmp_path: Path):
+    """Test that the first remote is used when there is no origin."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    config_path = git_dir / "config"
+    config_content = """
+[remote "upstream"]
+\turl = git@github.com:upstream-org/upstream-repo.git
+[remote "fork"]
+\turl = git@github.com:fork-org/fork-repo.git
+"""
+    config_path.write_text(config_content)
+    org, project = get_git_info(str(config_path))
+    assert org == "upstream-org"
+    assert project == "upstream-repo"
+
+
 def test_get_git_info_no_url(tmp_path: Path):
     """Test when url is missing in [remote "origin"]."""
     git_dir = tmp_path / ".git"
@@ -511,20 +910,52 @@ def test_get_git_info_os_error_on_exists(mock_exists):
     mock_exists.assert_called_once()
 
 
-@patch("configparser.ConfigParser.read")
-def test_get_git_info_parser_error(mock_read, tmp_path: Path):
-    """Test handling configparser error during read."""
-    git_dir = tmp_path / ".git"
-    git_dir.mkdir()
-    config_path = git_dir / "config"
-    config_path.touch()  # Create the file so os.path.exists passes
+def test_get_git_info_cached_until_modified(tmp_path: Path):
+    """Test that the config is re-read only when its mtime changes."""
+    config_path = tmp_path / "config"
+    config_path.write_text('[remote "origin"]\nurl = git@github.com:org-a/repo-a.git\n')
+
+    with patch("builtins.open", wraps=open) as mock_open:
+        assert get_git_info(str(config_path)) == ("org-a", "repo-a")
+        assert get_git_info(str(config_path)) == ("org-a", "repo-a")
+    assert mock_open.call_count == 1
 
-    mock_read.side_effect = configparser.ParsingError("Bad format")
+    config_path.write_text('[remote "origin"]\nurl = git@github.com:org-b/repo-b.git\n')
+    os.utime(config_path, (0, 0))
+    assert get_git_info(str(config_path)) == ("org-b", "repo-b")
+
+
+def test_get_git_info_read_error(tmp_path: Path):
+    """Test handling an error while reading the config file."""
+    config_path = tmp_path / ".git" / "config"
+    config_path.mkdir(parents=True)  # A directory: exists, but cannot be opened
 
     org, project = get_git_info(str(config_path))
     assert org is None
     assert project is None
-    mock_read.assert_called_once_with(str(config_path))
+
+
+def test_get_git_info_full_config(tmp_path: Path):
+    """Test a realistic config with other sections and repeated keys."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    config_path = git_dir / "config"
+    config_content = """
+[core]
+\tbare = false
+[remote "upstream"]
+\turl = git@github.com:upstream-org/upstream-repo.git
+[remote "origin"]
+\tfetch = +refs/heads/*:refs/remotes/origin/*
+\tfetch = +refs/tags/*:refs/tags/*
+\turl = git@github.com:test-org/test-repo.git
+[branch "main"]
+\tremote = origin
+"""
+    config_path.write_text(config_content)
+    org, project = get_git_info(str(config_path))
+    assert org == "test-org"
+    assert project == "test-repo"
 
 
 @pytest.mark.asyncio
@@ -614,18 +1045,116 @@ async def test_update_issue_handler_no_fields():
     assert "No fields provided to update" in result.message
 
 
+@pytest.mark.asyncio
+async def test_batch_execute_handler():
+    """Test that sub-calls run concurrently and failures stay isolated."""
+    both_in_flight = threading.Barrier(2, timeout=5)
+
+    def get_issue(issue, **kwargs):
+        both_in_flight.wait()  # Both get_issue calls must run at the same time
+        return {"id": issue}
+
+    mock_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_client_instance.get_issue.side_effect = get_issue
+    calls = [
+        SubCall(tool="get_issue", args={"issue": "SB-1"}),
+        SubCall(tool="get_issue", args={"issue": "SB-2"}),
+        SubCall(tool="update_issue", args={"unknown_arg": 1}),
+    ]
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_client_instance):
+        output = await batch_execute_handler(calls=calls)
+
+    assert isinstance(output, BatchExecuteOutput)
+    assert [r.status for r in output.results] == ["ok", "ok", "error"]
+    assert output.results[0].result == {"id": "SB-1"}
+    assert output.results[1].result == {"id": "SB-2"}
+    assert (
+        "Unknown argument(s) for update_issue: unknown_arg" in output.results[2].error
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_handler_validates_arguments():
+    """Sub-call arguments are validated against the tool's signature."""
+    mock_client_instance = MagicMock(spec=SpaceBridgeClient)
+    calls = [
+        SubCall(
+            tool="create_issue", args={"title": "T", "description": "D", "labels": 5}
+        ),
+        SubCall(tool="get_issue", args={"issue": 123}),
+    ]
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_client_instance):
+        output = await batch_execute_handler(calls=calls)
+
+    assert [r.status for r in output.results] == ["error", "error"]
+    assert all("ValidationError" in r.error for r in output.results)
+    mock_client_instance.create_issue.assert_not_called()
+    mock_client_instance.get_issue.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_handler_does_not_time_out_writes():
+    """timeout_ms applies to reads but never abandons a create or update."""
+
+    def slow_update(issue, **kwargs):
+        time.sleep(0.1)
+        return {"id": issue, "url": None}
+
+    def slow_get(issue, **kwargs):
+        time.sleep(0.1)
+        return {"id": issue}
+
+    mock_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_client_instance.update_issue.side_effect = slow_update
+    mock_client_instance.get_issue.side_effect = slow_get
+    calls = [
+        SubCall(
+            tool="update_issue", args={"issue": "SB-1", "status": "Done"}, timeout_ms=10
+        ),
+        SubCall(tool="get_issue", args={"issue": "SB-2"}, timeout_ms=10),
+    ]
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_client_instance):
+        output = await batch_execute_handler(calls=calls)
+
+    assert [r.status for r in output.results] == ["ok", "error"]
+    assert "TimeoutError" in output.results[1].error
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", ["0", "-3"])
+async def test_batch_execute_handler_invalid_concurrency(monkeypatch, concurrency):
+    """Test that a non-positive concurrency limit falls back to the default."""
+    monkeypatch.setenv("SPACEBRIDGE_BATCH_MAX_CONCURRENCY", concurrency)
+    mock_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_client_instance.get_issue.return_value = {"id": "SB-1"}
+    calls = [SubCall(tool="get_issue", args={"issue": "SB-1"})]
+    with patch("spacebridge_mcp.server.spacebridge_client", mock_client_instance):
+        output = await asyncio.wait_for(batch_execute_handler(calls=calls), timeout=5)
+
+    assert [r.status for r in output.results] == ["ok"]
+
+
 # --- Test Configuration Loading ---
 
+
+@pytest.fixture
+def no_background_version_check():
+    """Keeps main_sync from starting the real version-check thread."""
+    with patch("spacebridge_mcp.server._run_version_check") as mock_run:
+        yield mock_run
+
+
 # --- Test Configuration Loading in main_sync ---
 
 
+@pytest.mark.usefixtures("version_check_state", "no_background_version_check")
 @patch("argparse.ArgumentParser.parse_args")
 @patch("spacebridge_mcp.server.load_dotenv")  # Patch where it's used
 @patch("os.path.exists")
 @patch("os.getenv")
 @patch("spacebridge_mcp.server.get_git_info")
 @patch("spacebridge_mcp.server.SpaceBridgeClient")  # Mock client initialization
-@patch("spacebridge_mcp.server.openai.AsyncOpenAI")  # Mock openai client initialization
+@patch("spacebridge_mcp.server.make_shared_client")  # Mock openai client initialization
 @patch(
     "spacebridge_mcp.server.perform_version_check", return_value=True
 )  # Assume version check passes
@@ -672,7 +1201,7 @@ def test_main_sync_config_precedence(
         project_name="arg_proj",
     )
     # Assert OpenAI client initialized with arg value
-    mock_openai_init.assert_called_with(api_key="arg_openai")
+    mock_openai_init.assert_called_with("arg_openai", base_url=None)
     mock_load_dotenv.assert_called_once()  # Should be called once per main_sync run
     mock_get_git_info.assert_not_called()  # Git detection skipped due to args
     mock_sb_client_init.reset_mock()
@@ -699,7 +1228,7 @@ def test_main_sync_config_precedence(
         org_name="env_org",
         project_name="env_proj",
     )
-    mock_openai_init.assert_called_with(api_key="env_openai")
+    mock_openai_init.assert_called_with("env_openai", base_url=None)
     mock_get_git_info.assert_not_called()  # Git detection skipped due to env vars
     mock_sb_client_init.reset_mock()
     mock_openai_init.reset_mock()
@@ -729,7 +1258,7 @@ def test_main_sync_config_precedence(
         org_name="git_org",
         project_name="git_proj",  # API keys from args, context from git
     )
-    mock_openai_init.assert_called_with(api_key="arg_openai")
+    mock_openai_init.assert_called_with("arg_openai", base_url=None)
     mock_get_git_info.assert_called_once()  # Git detection should be called
     mock_get_git_info.reset_mock()
     mock_sb_client_init.reset_mock()
@@ -760,17 +1289,132 @@ def test_main_sync_config_precedence(
         org_name="git_org_custom",
         project_name="git_proj_custom",
     )
-    mock_openai_init.assert_called_with(api_key="arg_openai")
+    mock_openai_init.assert_called_with("arg_openai", base_url=None)
     # Assert get_git_info called with the custom path
     mock_get_git_info.assert_called_once_with(
         os.path.join("/custom/path", ".git/config")
     )
 
 
+@pytest.mark.usefixtures("version_check_state", "no_background_version_check")
+@patch("argparse.ArgumentParser.parse_args")
+@patch("spacebridge_mcp.server.load_dotenv")
+@patch("os.path.exists")
+@patch("spacebridge_mcp.server.SpaceBridgeClient")
+@patch("spacebridge_mcp.server.make_shared_client")
+@patch("spacebridge_mcp.server.perform_version_check", return_value=True)
+@patch("spacebridge_mcp.server.app.run")
+def test_main_sync_skip_dotenv(
+    mock_app_run,
+    mock_version_check,
+    mock_openai_init,
+    mock_sb_client_init,
+    mock_os_path_exists,
+    mock_load_dotenv,
+    mock_parse_args,
+    monkeypatch,
+):
+    """Test that SPACEBRIDGE_SKIP_DOTENV avoids looking for a .env file."""
+    mock_parse_args.return_value = argparse.Namespace(
+        spacebridge_api_url="arg_url",
+        spacebridge_api_key="arg_key",
+        openai_api_key="arg_openai",
+        org_name="arg_org",
+        project_name="arg_proj",
+        project_dir=None,
+    )
+    monkeypatch.setenv("SPACEBRIDGE_SKIP_DOTENV", "1")
+
+    main_sync()
+
+    mock_load_dotenv.assert_not_called()
+    assert mock_os_path_exists.call_count == 0
+    mock_app_run.assert_called_once()
+
+
+@pytest.mark.usefixtures("version_check_state", "no_background_version_check")
+@patch("argparse.ArgumentParser.parse_args")
+@patch("spacebridge_mcp.server.get_git_info")
+@patch("spacebridge_mcp.server.SpaceBridgeClient")
+@patch("spacebridge_mcp.server.make_shared_client")
+@patch("spacebridge_mcp.server.perform_version_check", return_value=True)
+@patch("spacebridge_mcp.server.app.run")
+def test_main_sync_skip_git_detect(
+    mock_app_run,
+    mock_version_check,
+    mock_openai_init,
+    mock_sb_client_init,
+    mock_get_git_info,
+    mock_parse_args,
+    monkeypatch,
+):
+    """Test that SPACEBRIDGE_SKIP_GIT_DETECT leaves missing context unset."""
+    mock_parse_args.return_value = argparse.Namespace(
+        spacebridge_api_url="arg_url",
+        spacebridge_api_key="arg_key",
+        openai_api_key="arg_openai",
+        org_name="arg_org",
+        project_name=None,
+        project_dir=None,
+    )
+    monkeypatch.setenv("SPACEBRIDGE_SKIP_DOTENV", "1")
+    monkeypatch.setenv("SPACEBRIDGE_SKIP_GIT_DETECT", "true")
+    monkeypatch.setattr(server, "_detector_factory", None)
+    monkeypatch.delenv("SPACEBRIDGE_PROJECT_NAME", raising=False)
+
+    main_sync()
+
+    mock_get_git_info.assert_not_called()
+    # The shared detector is built at startup, for the new OpenAI client
+    assert server._detector_factory.openai_client is mock_openai_init.return_value
+    mock_sb_client_init.assert_called_once_with(
+        api_url="arg_url", api_key="arg_key", org_name="arg_org", project_name=None
+    )
+
+
 # --- Test Version Check ---
 # (Existing version check tests remain largely the same, but ensure they patch the correct client instance if needed)
 
 
+@pytest.fixture(autouse=True)
+def clear_client_version_cache(monkeypatch):
+    """Lets each test patch the package version seen by perform_version_check."""
+    monkeypatch.setattr("spacebridge_mcp.server._version_check_passed", False)
+    _get_client_version.cache_clear()
+    yield
+    _get_client_version.cache_clear()
+
+
+@patch("importlib.metadata.version")
+def test_client_version_looked_up_once(mock_meta_version):
+    """Test that the package metadata is only scanned on the first check."""
+    mock_meta_version.return_value = "0.2.0"
+    mock_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_client_instance.get_version.return_value = {"server_version": "1.0.0"}
+
+    perform_version_check(mock_client_instance)
+    perform_version_check(mock_client_instance)
+
+    mock_meta_version.assert_called_once_with("spacebridge-mcp")
+
+
+@patch("importlib.metadata.version")
+def test_perform_version_check_runs_once_after_success(mock_meta_version):
+    """Test that a passed check is not repeated, but a failed one is."""
+    mock_meta_version.return_value = "0.0.5"
+    mock_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_client_instance.get_version.side_effect = [
+        Exception("API unavailable"),
+        {"server_version": "1.0.0", "min_client_version": "0.0.1"},
+    ]
+
+    assert perform_version_check(mock_client_instance) is True
+    assert perform_version_check(mock_client_instance) is True
+    assert perform_version_check(mock_client_instance) is True
+
+    assert mock_client_instance.get_version.call_count == 2
+
+
 @patch("importlib.metadata.version")
 # Note: These tests now mock the client *instance* passed to the function
 def test_perform_version_check_compatible(mock_meta_version):
@@ -851,3 +1495,92 @@ def test_perform_version_check_cant_get_own_version(mock_meta_version, capsys):
     )  # Should fail because 0.0.0 < 0.1.0
     # Check it called get_version with fallback version
     mock_client_instance.get_version.assert_called_once_with(client_version="0.0.0")
+
+
+@patch("importlib.metadata.version")
+def test_perform_version_check_quiet(mock_meta_version, capsys):
+    """Test that echo=False keeps version warnings off stdout."""
+    mock_meta_version.return_value = "0.1.5"
+    mock_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_client_instance.get_version.return_value = {
+        "server_version": "1.0.0",
+        "max_client_version": "0.2.0",
+    }
+    assert perform_version_check(mock_client_instance, echo=False) is True
+    assert capsys.readouterr().out == ""
+
+
+@patch("importlib.metadata.version")
+def test_perform_version_check_unknown_server_version(mock_meta_version):
+    """Test that a missing server version lets startup proceed."""
+    mock_meta_version.return_value = "0.1.5"
+    mock_client_instance = MagicMock(spec=SpaceBridgeClient)
+    mock_client_instance.get_version.return_value = {}
+    assert perform_version_check(mock_client_instance) is True
+
+
+@pytest.fixture
+def version_check_state(monkeypatch):
+    """Gives each test a fresh background version-check state."""
+    monkeypatch.setattr(server, "_version_rejected", threading.Event())
+    monkeypatch.setattr(server, "_serving", False)
+
+
+@pytest.mark.usefixtures("version_check_state")
+@patch("spacebridge_mcp.server._thread.interrupt_main")
+@patch("spacebridge_mcp.server.perform_version_check")
+def test_run_version_check_stops_server_when_client_too_old(mock_check, mock_interrupt):
+    """Test that the background check stops the server only on a failed check."""
+    mock_client_instance = MagicMock(spec=SpaceBridgeClient)
+    server._serving = True
+
+    mock_check.return_value = True
+    _run_version_check(mock_client_instance)
+    mock_check.assert_called_with(mock_client_instance, echo=False)
+    mock_check.return_value = None
+    _run_version_check(mock_client_instance)
+    mock_interrupt.assert_not_called()
+    assert not server._version_rejected.is_set()
+
+    mock_check.return_value = False
+    _run_version_check(mock_client_instance)
+    mock_interrupt.assert_called_once_with()
+    assert server._version_rejected.is_set()
+
+
+@pytest.mark.usefixtures("version_check_state")
+@patch("spacebridge_mcp.server._thread.interrupt_main")
+@patch("spacebridge_mcp.server.perform_version_check", return_value=False)
+def test_run_version_check_before_serving_only_flags(mock_check, mock_interrupt):
+    """A rejection before the server starts is left for main_sync to act on."""
+    _run_version_check(MagicMock(spec=SpaceBridgeClient))
+
+    assert server._version_rejected.is_set()
+    mock_interrupt.assert_not_called()
+
+
+@pytest.mark.usefixtures("version_check_state", "no_background_version_check")
+@patch("argparse.ArgumentParser.parse_args")
+@patch("spacebridge_mcp.server.SpaceBridgeClient")
+@patch("spacebridge_mcp.server.make_shared_client")
+@patch("spacebridge_mcp.server.app.run")
+def test_main_sync_does_not_serve_rejected_client(
+    mock_app_run, mock_openai_init, mock_sb_client_init, mock_parse_args, monkeypatch
+):
+    """Test that main_sync exits with an error once the client was rejected."""
+    mock_parse_args.return_value = argparse.Namespace(
+        spacebridge_api_url="arg_url",
+        spacebridge_api_key="arg_key",
+        openai_api_key="arg_openai",
+        org_name="arg_org",
+        project_name="arg_proj",
+        project_dir=None,
+    )
+    monkeypatch.setenv("SPACEBRIDGE_SKIP_DOTENV", "1")
+    server._version_rejected.set()
+
+    with pytest.raises(SystemExit) as excinfo:
+        main_sync()
+
+    assert excinfo.value.code == 1
+    mock_app_run.assert_not_called()